@@ -2,20 +2,50 @@
 
 import os
 import sys
+import socket
 import json
+import zlib
 import time
+import heapq
+import hashlib
+import random
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import logging
-from functools import partial
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from collections import deque
+from functools import lru_cache, partial, wraps
+from itertools import zip_longest
+from concurrent.futures import Future, ThreadPoolExecutor
 import re
+from dataclasses import dataclass, asdict, fields
 from urllib.parse import urlparse, parse_qs
 
+# Use orjson for JSON encoding/decoding when it is bundled, stdlib json otherwise
+try:
+    import orjson
+
+    def dumps_json(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads_json(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def dumps_json(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads_json(data: bytes) -> Any:
+        return json.loads(data)
+
 # Android-specific imports
 try:
-    from android.permissions import request_permissions, Permission
+    from android.permissions import request_permissions, check_permission, Permission
     from android.storage import primary_external_storage_path
     from jnius import autoclass, PythonJavaClass, java_method
     from android.runnable import run_on_ui_thread
@@ -29,6 +59,10 @@ try:
     Cursor = autoclass('android.database.Cursor')
     PythonActivity = autoclass('org.kivy.android.PythonActivity')
     Intent = autoclass('android.content.Intent')
+    Bundle = autoclass('android.os.Bundle')
+    BuildVersion = autoclass('android.os.Build$VERSION')
+    ComponentCallbacks2 = autoclass('android.content.ComponentCallbacks2')
+    NetworkCapabilities = autoclass('android.net.NetworkCapabilities')
 
     # QR Scanner imports
     try:
@@ -51,6 +85,9 @@ from kivy.logger import Logger
 from kivy.storage.jsonstore import JsonStore
 from kivy.utils import platform
 from kivy.metrics import dp
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 
 # KivyMD imports
 from kivymd.app import MDApp
@@ -74,12 +111,83 @@ from kivymd.icon_definitions import md_icons
 from kivymd.uix.snackbar import Snackbar
 
 
+@dataclass(slots=True)
+class DeviceInfo:
+    """Registered device details, parsed once from the stored 'device_info' entry"""
+    device_id: Optional[str] = None
+    device_name: Optional[str] = None
+    registration_time: Optional[str] = None
+    sync_endpoint: Optional[str] = None
+    status_endpoint: Optional[str] = None
+    heartbeat_endpoint: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DeviceInfo':
+        """Build from a stored dict, ignoring unknown keys"""
+        return cls(**{f.name: data.get(f.name) for f in fields(cls)})
+
+
 class SimpleNotification:
     """Enhanced notification system with Snackbar support"""
 
+    SUCCESS_COLOR = (0, 1, 0, 1)
+    INFO_COLOR = (0, 0, 1, 1)
+    ERROR_COLOR = (1, 0, 0, 1)
+
+    # Messages waiting to be shown; the oldest are dropped during a burst
+    _queue = deque(maxlen=64)
+    _pending = False
+    _last_shown = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _enqueue(message: str, color):
+        """Queue a message; a queued info message is superseded by the next one (progress updates)"""
+        cls = SimpleNotification
+        if color == cls.INFO_COLOR and cls._queue and cls._queue[-1][1] == cls.INFO_COLOR:
+            cls._queue[-1] = (message, color)
+        else:
+            cls._queue.append((message, color))
+
     @staticmethod
-    @mainthread
     def show_message(message: str, color=(0, 1, 0, 1)):
+        """Show a message now when on the main thread and idle, else queue it"""
+        cls = SimpleNotification
+        with cls._lock:
+            wait = cls._last_shown + 0.5 - time.monotonic()
+            if cls._pending:
+                cls._enqueue(message, color)
+                return
+            if wait <= 0 and threading.current_thread() is threading.main_thread():
+                cls._last_shown = time.monotonic()
+            else:
+                cls._enqueue(message, color)
+                cls._pending = True
+                message = None
+        if message is None:
+            Clock.schedule_once(cls._flush, max(wait, 0))
+        else:
+            cls._show(message, color)
+
+    @staticmethod
+    def _flush(dt):
+        """Show one queued message, rescheduling while more remain"""
+        cls = SimpleNotification
+        with cls._lock:
+            if not cls._queue:
+                cls._pending = False
+                return
+            message, color = cls._queue.popleft()
+            cls._last_shown = time.monotonic()
+            more = bool(cls._queue)
+            if not more:
+                cls._pending = False
+        cls._show(message, color)
+        if more:
+            Clock.schedule_once(cls._flush, 0.5)
+
+    @staticmethod
+    def _show(message: str, color):
         """Show a message using Snackbar"""
         try:
             snackbar = Snackbar(
@@ -90,18 +198,19 @@ class SimpleNotification:
             snackbar.open()
         except Exception:
             # Fallback to print
-            status = "SUCCESS" if color == (0, 1, 0, 1) else "INFO" if color == (0, 0, 1, 1) else "ERROR"
+            cls = SimpleNotification
+            status = "SUCCESS" if color == cls.SUCCESS_COLOR else "INFO" if color == cls.INFO_COLOR else "ERROR"
             print(f"[{status}] {message}")
 
     @staticmethod
     def show_error(message: str):
         """Show error message"""
-        SimpleNotification.show_message(message, (1, 0, 0, 1))
+        SimpleNotification.show_message(message, SimpleNotification.ERROR_COLOR)
 
     @staticmethod
     def show_info(message: str):
         """Show info message"""
-        SimpleNotification.show_message(message, (0, 0, 1, 1))
+        SimpleNotification.show_message(message, SimpleNotification.INFO_COLOR)
 
 
 class QRScannerManager:
@@ -150,7 +259,7 @@ class QRScannerManager:
                 if contents and self.callback:
                     Clock.schedule_once(lambda dt: self.callback(contents), 0)
             else:
-                Clock.schedule_once(lambda dt: SimpleNotification.show_error("QR scan cancelled"), 0)
+                SimpleNotification.show_error("QR scan cancelled")
 
     def _show_manual_input_dialog(self):
         """Show manual QR input dialog as fallback"""
@@ -160,21 +269,58 @@ class QRScannerManager:
 class CallLogManager:
     """Enhanced call log manager with aggressive syncing and retry logic"""
 
+    CACHE_TTL = 30  # Seconds a cached read stays valid
+    CALL_TYPES = (  # Indexed by Android CallLog.Calls.TYPE (1-6) -> our format
+        'unknown',
+        'incoming',
+        'outgoing',
+        'missed',
+        'voicemail',
+        'rejected',
+        'blocked'
+    )
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.permissions_granted = False
         self.last_call_count = 0
         self.sync_lock = threading.Lock()
-        self._call_cache = []
-        self._last_refresh = None
+        self._call_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}  # limit -> (monotonic time, calls)
+        self._permission_result = threading.Event()  # Set by the permission dialog callback
+        self._permission_request_lock = threading.Lock()  # Held while a dialog is up; one request at a time
+
+        # JNI handles resolved once and reused by every query
+        self._resolver = None
+        self._calls_uri = None
+        self._projection = None
+        if ANDROID_AVAILABLE:
+            try:
+                context = PythonActivity.mActivity.getApplicationContext()
+                self._resolver = context.getContentResolver()
+                self._calls_uri = CallLog.Calls.CONTENT_URI
+                self._projection = [
+                    CallLog.Calls.NUMBER,
+                    CallLog.Calls.CACHED_NAME,
+                    CallLog.Calls.TYPE,
+                    CallLog.Calls.DATE,
+                    CallLog.Calls.DURATION,
+                    CallLog.Calls._ID
+                ]
+            except Exception as e:
+                self.logger.error(f"Error resolving content resolver: {e}")
 
-    def request_permissions(self) -> bool:
-        """Request necessary Android permissions with retry logic"""
+    def request_permissions(self, timeout: float = 60) -> bool:
+        """Request necessary Android permissions, waiting for the dialog result (off the UI thread)"""
         if not ANDROID_AVAILABLE:
             self.logger.warning("Android not available - skipping permission request")
             return False
 
         try:
+            # Already granted: no dialog, no wait
+            if check_permission(Permission.READ_CALL_LOG):
+                self.permissions_granted = True
+                return True
+
             # Request all necessary permissions aggressively
             permissions = [
                 Permission.READ_CALL_LOG,
@@ -187,155 +333,286 @@ class CallLogManager:
                 Permission.CAMERA  # For QR scanner
             ]
 
-            self.logger.info("🔐 Requesting Android permissions...")
-
-            # Multiple attempts to ensure permissions are granted
-            for attempt in range(3):
-                try:
-                    request_permissions(permissions)
-                    time.sleep(2)  # Wait for permission dialog
+            # A dialog is already up: share its result rather than clearing the event and re-requesting
+            if not self._permission_request_lock.acquire(blocking=False):
+                self._permission_result.wait(timeout)
+                return self.permissions_granted
 
-                    # Check if we can access call logs
-                    test_calls = self._test_call_log_access()
-                    if test_calls is not None:
-                        self.permissions_granted = True
-                        self.logger.info(f"✅ Permissions granted successfully (attempt {attempt + 1})")
-                        return True
-
-                except Exception as e:
-                    self.logger.warning(f"Permission attempt {attempt + 1} failed: {e}")
-
-            self.logger.error("❌ Failed to obtain permissions after 3 attempts")
-            return False
+            try:
+                self.logger.info("🔐 Requesting Android permissions...")
+
+                # Android shows the dialog once per request; wait for its callback instead of polling
+                self._permission_result.clear()
+                request_permissions(permissions, self._on_permissions_result)
+                if not self._permission_result.wait(timeout):
+                    self.logger.warning("Permission dialog not answered within %ss", timeout)
+            finally:
+                self._permission_request_lock.release()
+
+            if self.permissions_granted:
+                self.logger.info("✅ Permissions granted successfully")
+            else:
+                self.logger.error("❌ Call log permission not granted")
+            return self.permissions_granted
 
         except Exception as e:
             self.logger.error(f"Error requesting permissions: {e}")
             return False
 
-    def _test_call_log_access(self) -> Optional[List]:
-        """Test if we can access call logs"""
-        try:
-            activity = PythonActivity.mActivity
-            context = activity.getApplicationContext()
-            content_resolver = context.getContentResolver()
-
-            uri = CallLog.Calls.CONTENT_URI
-            cursor = content_resolver.query(uri, None, None, None, f"{CallLog.Calls.DATE} DESC LIMIT 1")
-
-            if cursor:
-                cursor.close()
-                return []  # Empty list but accessible
-            return None
+    def check_granted(self) -> bool:
+        """Whether call logs can be read, re-checking (without a dialog) a grant made in system settings"""
+        if not self.permissions_granted:
+            try:
+                self.permissions_granted = bool(check_permission(Permission.READ_CALL_LOG))
+            except Exception as e:
+                self.logger.error("Error checking call log permission: %s", e)
+        return self.permissions_granted
 
-        except Exception:
-            return None
+    def _on_permissions_result(self, permissions: List[str], grants: List[bool]):
+        """Permission dialog callback; only the call log grant gates syncing"""
+        results = dict(zip(permissions, grants))
+        self.permissions_granted = bool(results.get(Permission.READ_CALL_LOG, False))
+        self._permission_result.set()
 
     def get_call_logs(self, limit: int = 1000, force_refresh: bool = False) -> List[Dict[str, Any]]:
-        """Get call logs with caching and aggressive refresh"""
+        """Get the most recent call logs with caching and aggressive refresh
+
+        A forced refresh waits for any read in flight and then queries again, so
+        its result is the one rendered last. Incremental reads go through iter_calls_since.
+        """
         with self.sync_lock:
-            # Check cache first
-            now = datetime.now()
-            if (not force_refresh and self._call_cache and self._last_refresh and
-                    (now - self._last_refresh).total_seconds() < 30):  # 30 second cache
-                return self._call_cache
+            # Check cache first; entries are per limit so small and large reads don't mix
+            cached = self._call_cache.get(limit)
+            if not force_refresh:
+                if cached and time.monotonic() - cached[0] < self.CACHE_TTL:
+                    return cached[1]
+
+                # Rows are newest first, so a fresh larger read already holds this one as a prefix
+                shared = self._cached_prefix(limit)
+                if shared is not None:
+                    return shared
 
             if not ANDROID_AVAILABLE:
                 self.logger.warning("Android not available - cannot retrieve call logs")
                 return []
 
-            if not self.permissions_granted:
-                self.logger.warning("Permissions not granted - attempting to request again")
-                self.request_permissions()
-                if not self.permissions_granted:
-                    return []
+            # Never wait on the permission dialog here, with sync_lock held;
+            # the app's request_permissions_aggressively drives it
+            if not self.check_granted():
+                self.logger.warning("Permissions not granted - cannot retrieve call logs")
+                return []
 
             try:
                 calls = self._fetch_calls_from_android(limit)
 
                 # Update cache
-                self._call_cache = calls
-                self._last_refresh = now
+                self._call_cache[limit] = (time.monotonic(), calls)
 
                 # Check for new calls and trigger immediate sync if needed
                 if len(calls) != self.last_call_count:
-                    self.logger.info(f"📞 Call count changed: {self.last_call_count} -> {len(calls)}")
+                    self.logger.info("📞 Call count changed: %s -> %s", self.last_call_count, len(calls))
                     self.last_call_count = len(calls)
 
                     # Trigger immediate sync in background
                     if hasattr(self, '_app_instance'):
-                        threading.Thread(
-                            target=self._trigger_immediate_sync,
-                            args=(calls,),
-                            daemon=True
-                        ).start()
+                        self._app_instance.run_in_background(self._trigger_immediate_sync, calls)
 
                 return calls
 
             except Exception as e:
-                self.logger.error(f"Error getting call logs: {e}")
-                return self._call_cache if self._call_cache else []
+                self.logger.error("Error getting call logs: %s", e)
+                return cached[1] if cached else []
+
+    def _cached_prefix(self, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """First limit rows of a fresh cached read of at least limit rows, if any (call with sync_lock held)"""
+        now = time.monotonic()
+        for cached_limit, (cached_at, calls) in self._call_cache.items():
+            if cached_limit > limit and now - cached_at < self.CACHE_TTL:
+                return calls[:limit]
+        return None
+
+    def invalidate_cache(self):
+        """Drop all cached reads so the next get_call_logs hits the provider"""
+        with self.sync_lock:
+            self._call_cache.clear()
+
+    def cached_call_count(self) -> int:
+        """Number of call rows currently held in the read cache"""
+        return sum(len(calls) for _, calls in list(self._call_cache.values()))
+
+    def get_call_logs_iter(self, batch: int = 100, limit: int = 1000):
+        """Yield the most recent call logs, newest first, in batches from a single open cursor"""
+        batches = self._iter_call_batches(batch, limit)
+        try:
+            for calls, _ in batches:
+                yield calls
+        finally:
+            batches.close()
+
+    def iter_calls_since(self, since_ts: int, batch: int = 100):
+        """Yield (calls, DATE of the batch's newest call in epoch ms) for every call newer than since_ts
+
+        Rows come oldest first with no limit, so however many calls have piled up none are
+        skipped, and a caller can advance its watermark to exactly the last batch it handled.
+        """
+        return self._iter_call_batches(batch, None, since_ts, oldest_first=True)
+
+    def _iter_call_batches(self, batch: int, limit: Optional[int], since_ts: Optional[int] = None,
+                           oldest_first: bool = False):
+        """Walk one cursor, yielding (calls, raw DATE of the batch's last row) per batch"""
+        if not ANDROID_AVAILABLE:
+            self.logger.warning("Android not available - cannot retrieve call logs")
+            return
+
+        if not self.check_granted():
+            self.logger.warning("Permissions not granted - cannot retrieve call logs")
+            return
+
+        cursor = self._query_calls(limit, since_ts, oldest_first=oldest_first)
+        try:
+            if cursor and cursor.moveToFirst():
+                columns = self._column_indices(cursor)
+                getters = self._cursor_getters(cursor)
+                row_template = self._row_template(0)
+                get_long = getters[2]
+                idx_date = columns[3]
+                calls = []
+                rows = 0
+                while True:
+                    try:
+                        calls.append(self._row_to_call(getters, columns, row_template))
+                    except Exception as row_error:
+                        self.logger.warning("Error processing call row: %s", row_error)
+                    rows += 1
+
+                    # The DATE column itself, not the formatted local time, which is ambiguous across DST changes
+                    if len(calls) >= batch:
+                        yield calls, get_long(idx_date)
+                        calls = []
+
+                    # Stop at limit ourselves too: providers may not honour QUERY_ARG_LIMIT
+                    if limit is not None and rows >= limit:
+                        break
+                    if not cursor.moveToNext():
+                        cursor.moveToLast()  # Back onto the final row for its DATE
+                        break
+
+                if calls:
+                    yield calls, get_long(idx_date)
+        finally:
+            if cursor:
+                cursor.close()
+
+    def _query_calls(self, limit: Optional[int], since_ts: Optional[int] = None, oldest_first: bool = False):
+        """Open a cursor over call log entries by date, optionally newer than since_ts
+
+        Rows are newest first unless oldest_first is set; limit None reads every matching row.
+        """
+        content_resolver = self._resolver
+        uri = self._calls_uri
+        projection = self._projection
+
+        selection = None
+        selection_args = None
+        if since_ts is not None:
+            selection = f"{CallLog.Calls.DATE} > ?"
+            selection_args = [str(since_ts)]
+
+        # API 30+: pass sort and limit as query args; 'LIMIT' inside sortOrder is not guaranteed there.
+        # Below 30 the provider's Bundle-to-legacy query() conversion drops QUERY_ARG_LIMIT, while the
+        # sortOrder form still works, so older devices keep using it
+        if BuildVersion.SDK_INT >= 30:
+            query_args = Bundle()
+            if selection:
+                query_args.putString(ContentResolver.QUERY_ARG_SQL_SELECTION, selection)
+                query_args.putStringArray(ContentResolver.QUERY_ARG_SQL_SELECTION_ARGS, selection_args)
+            query_args.putStringArray(ContentResolver.QUERY_ARG_SORT_COLUMNS, [CallLog.Calls.DATE])
+            query_args.putInt(ContentResolver.QUERY_ARG_SORT_DIRECTION,
+                              ContentResolver.QUERY_SORT_DIRECTION_ASCENDING if oldest_first
+                              else ContentResolver.QUERY_SORT_DIRECTION_DESCENDING)
+            if limit is not None:
+                query_args.putInt(ContentResolver.QUERY_ARG_LIMIT, limit)
+            return content_resolver.query(uri, projection, query_args, None)
+
+        sort_order = f"{CallLog.Calls.DATE} {'ASC' if oldest_first else 'DESC'}"
+        if limit is not None:
+            sort_order += f" LIMIT {limit}"
+        return content_resolver.query(
+            uri,
+            projection,
+            selection,
+            selection_args,
+            sort_order
+        )
+
+    def _column_indices(self, cursor) -> Tuple[int, int, int, int, int, int]:
+        """Resolve projection column indices once per cursor instead of once per row"""
+        return tuple(cursor.getColumnIndex(column) for column in self._projection)
+
+    def _row_template(self, attempt: int) -> Dict[str, Any]:
+        """Fields shared by every row of one read, built once per batch"""
+        extracted_at = datetime.now().isoformat()
+        return {
+            'simSlot': 0,
+
+            # Enhanced metadata
+            'deviceTimestamp': extracted_at,
+            'extractedAt': extracted_at,
+            'dataSource': 'android_call_log',
+            'appVersion': '2.0.0',
+            'syncAttempt': attempt + 1
+        }
+
+    def _cursor_getters(self, cursor) -> Tuple[Any, Any, Any]:
+        """Bind the cursor's getString/getInt/getLong once per cursor instead of once per row"""
+        return cursor.getString, cursor.getInt, cursor.getLong
+
+    def _row_to_call(self, getters: Tuple[Any, Any, Any], columns: Tuple[int, int, int, int, int, int],
+                     row_template: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert the cursor's current row into a call dict"""
+        get_string, get_int, get_long = getters
+        idx_number, idx_name, idx_type, idx_date, idx_duration, idx_id = columns
+        call_type = get_int(idx_type)
+        return {
+            'phoneNumber': (get_string(idx_number) if idx_number >= 0 else None) or "Unknown",
+            'contactName': get_string(idx_name) if idx_name >= 0 else None,
+            'callType': self.CALL_TYPES[call_type] if 0 < call_type < 7 else 'unknown',
+            'timestamp': self._format_timestamp(get_long(idx_date)),
+            'duration': get_int(idx_duration),
+            'contactId': get_string(idx_id) if idx_id >= 0 else None,
+            **row_template
+        }
 
     def _fetch_calls_from_android(self, limit: int) -> List[Dict[str, Any]]:
         """Fetch calls from Android system with retry logic"""
         for attempt in range(3):  # Retry up to 3 times
             try:
-                activity = PythonActivity.mActivity
-                context = activity.getApplicationContext()
-                content_resolver = context.getContentResolver()
-
-                uri = CallLog.Calls.CONTENT_URI
-                projection = [
-                    CallLog.Calls.NUMBER,
-                    CallLog.Calls.CACHED_NAME,
-                    CallLog.Calls.TYPE,
-                    CallLog.Calls.DATE,
-                    CallLog.Calls.DURATION,
-                    CallLog.Calls._ID
-                ]
-
-                cursor = content_resolver.query(
-                    uri,
-                    projection,
-                    None,
-                    None,
-                    f"{CallLog.Calls.DATE} DESC LIMIT {limit}"
-                )
+                cursor = self._query_calls(limit)
 
                 calls = []
-                if cursor and cursor.moveToFirst():
-                    while not cursor.isAfterLast():
-                        try:
-                            call_data = {
-                                'phoneNumber': self._safe_get_string(cursor, CallLog.Calls.NUMBER) or "Unknown",
-                                'contactName': self._safe_get_string(cursor, CallLog.Calls.CACHED_NAME),
-                                'callType': self._get_call_type(
-                                    cursor.getInt(cursor.getColumnIndex(CallLog.Calls.TYPE))),
-                                'timestamp': self._format_timestamp(
-                                    cursor.getLong(cursor.getColumnIndex(CallLog.Calls.DATE))),
-                                'duration': cursor.getInt(cursor.getColumnIndex(CallLog.Calls.DURATION)),
-                                'contactId': self._safe_get_string(cursor, CallLog.Calls._ID),
-                                'simSlot': 0,
-
-                                # Enhanced metadata
-                                'deviceTimestamp': datetime.now().isoformat(),
-                                'extractedAt': datetime.now().isoformat(),
-                                'dataSource': 'android_call_log',
-                                'appVersion': '2.0.0',
-                                'syncAttempt': attempt + 1
-                            }
-                            calls.append(call_data)
-                        except Exception as row_error:
-                            self.logger.warning(f"Error processing call row: {row_error}")
-
-                        cursor.moveToNext()
-
-                    cursor.close()
-
-                self.logger.info(f"📞 Retrieved {len(calls)} call logs (attempt {attempt + 1})")
+                try:
+                    if cursor and cursor.moveToFirst():
+                        columns = self._column_indices(cursor)
+                        getters = self._cursor_getters(cursor)
+                        row_template = self._row_template(attempt)
+                        # At most limit rows, even if the provider ignored the limit it was given
+                        for _ in range(limit):
+                            try:
+                                calls.append(self._row_to_call(getters, columns, row_template))
+                            except Exception as row_error:
+                                self.logger.warning("Error processing call row: %s", row_error)
+
+                            if not cursor.moveToNext():
+                                break
+                finally:
+                    if cursor:
+                        cursor.close()
+
+                self.logger.info("Retrieved %d call logs (attempt %d)", len(calls), attempt + 1)
                 return calls
 
             except Exception as e:
-                self.logger.error(f"Attempt {attempt + 1} failed: {e}")
+                self.logger.error("Attempt %s failed: %s", attempt + 1, e)
                 if attempt < 2:  # Not the last attempt
                     time.sleep(1)  # Wait before retry
                     continue
@@ -351,56 +628,106 @@ class CallLogManager:
                 result = self._app_instance.backend_api.sync_calls(calls)
 
                 if result['success']:
-                    self.logger.info(f"✅ Immediate sync completed: {result.get('synced_count', 0)} calls")
-                    Clock.schedule_once(
-                        lambda dt: SimpleNotification.show_message(f"📞 Synced {result.get('synced_count', 0)} calls"),
-                        0
-                    )
+                    self.logger.info("✅ Immediate sync completed: %s calls", result.get('synced_count', 0))
+                    SimpleNotification.show_message(f"📞 Synced {result.get('synced_count', 0)} calls")
                 else:
-                    self.logger.error(f"❌ Immediate sync failed: {result.get('message')}")
+                    self.logger.error("❌ Immediate sync failed: %s", result.get('message'))
 
         except Exception as e:
-            self.logger.error(f"Error in immediate sync: {e}")
+            self.logger.error("Error in immediate sync: %s", e)
 
     def set_app_instance(self, app_instance):
         """Set app instance for callbacks"""
         self._app_instance = app_instance
 
-    def _safe_get_string(self, cursor, column_name: str) -> Optional[str]:
-        """Safely get string value from cursor"""
+    def newest_call_ms(self) -> Optional[int]:
+        """Raw DATE of the newest call in epoch ms; 0 for an empty log, None if the read failed"""
+        cursor = None
         try:
-            column_index = cursor.getColumnIndex(column_name)
-            if column_index >= 0:
-                return cursor.getString(column_index)
-        except Exception:
-            pass
-        return None
-
-    def _get_call_type(self, call_type: int) -> str:
-        """Convert Android call type to our format"""
-        type_mapping = {
-            1: 'incoming',
-            2: 'outgoing',
-            3: 'missed',
-            4: 'voicemail',
-            5: 'rejected',
-            6: 'blocked'
-        }
-        return type_mapping.get(call_type, 'unknown')
+            cursor = self._query_calls(1)
+            if cursor is None:
+                return None
+            if cursor.moveToFirst():
+                return cursor.getLong(cursor.getColumnIndex(CallLog.Calls.DATE))
+            return 0
+        except Exception as e:
+            self.logger.error("Error reading newest call date: %s", e)
+            return None
+        finally:
+            if cursor:
+                cursor.close()
 
     def _format_timestamp(self, timestamp_ms: int) -> str:
-        """Format timestamp from milliseconds to ISO format"""
+        """Format timestamp from milliseconds to ISO format (local time, as the server has always received)"""
         try:
             dt = datetime.fromtimestamp(timestamp_ms / 1000)
             return dt.isoformat() + 'Z'
         except Exception as e:
-            self.logger.error(f"Error formatting timestamp: {e}")
+            self.logger.error("Error formatting timestamp: %s", e)
             return datetime.now().isoformat() + 'Z'
 
 
+if ANDROID_AVAILABLE:
+    class TrimMemoryCallbacks(PythonJavaClass):
+        """Drops the call read cache when Android asks the backgrounded app to free memory"""
+
+        __javainterfaces__ = ['android/content/ComponentCallbacks2']
+        __javacontext__ = 'app'
+
+        def __init__(self, call_manager: CallLogManager):
+            super().__init__()
+            self.call_manager = call_manager
+
+        @java_method('(I)V')
+        def onTrimMemory(self, level):
+            if level >= ComponentCallbacks2.TRIM_MEMORY_BACKGROUND:
+                self.call_manager.invalidate_cache()
+
+        @java_method('()V')
+        def onLowMemory(self):
+            self.call_manager.invalidate_cache()
+
+        @java_method('(Landroid/content/res/Configuration;)V')
+        def onConfigurationChanged(self, config):
+            pass
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets send TCP keepalives
+
+    Mobile carrier NATs drop idle flows after roughly a minute, which
+    silently kills the pooled connection between heartbeats and forces a
+    fresh TLS handshake. Probing every 30s keeps the flow (and the TLS
+    session on it) alive for the lifetime of the app.
+    """
+
+    KEEPALIVE_IDLE = 30  # Seconds idle before the first probe
+    KEEPALIVE_INTERVAL = 15  # Seconds between probes
+    KEEPALIVE_COUNT = 3  # Failed probes before the socket is dropped
+
+    def init_poolmanager(self, *args, **kwargs):
+        socket_options = list(HTTPConnection.default_socket_options)
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Tuning knobs are Linux/Android-only
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            socket_options += [
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.KEEPALIVE_IDLE),
+                (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.KEEPALIVE_INTERVAL),
+                (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.KEEPALIVE_COUNT),
+            ]
+        kwargs['socket_options'] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
 class BackendAPI:
     """Enhanced backend API with aggressive retry and connection management"""
 
+    SYNC_CHUNK_SIZE = 250  # Calls per sync request
+    GZIP_LEVEL = 3  # Near-max ratio on repetitive call JSON at a fraction of level 9's CPU
+    CONNECT_TIMEOUT = 10  # Seconds; fail fast on a dead link, read timeouts are set per request
+    TOKEN_PATTERN = re.compile(r'^[a-f0-9]{64}$', re.IGNORECASE)  # QR connection token
+    NETWORK_TYPE_TTL = 5  # Seconds a network type lookup is reused
+
     def __init__(self, base_url: str = None):
         self.base_url = base_url or "https://kortahununited.onrender.com"
         self.api_base = f"{self.base_url}/api"
@@ -408,12 +735,50 @@ class BackendAPI:
         self.device_name = None
         self.session = requests.Session()
         self.logger = logging.getLogger(__name__)
+
+        # System services for heartbeat status, resolved once
+        self._battery_manager = None
+        self._connectivity_manager = None
+        if ANDROID_AVAILABLE:
+            try:
+                context = PythonActivity.mActivity.getApplicationContext()
+                self._battery_manager = context.getSystemService(Context.BATTERY_SERVICE)
+                self._connectivity_manager = context.getSystemService(Context.CONNECTIVITY_SERVICE)
+            except Exception as e:
+                self.logger.error(f"Error resolving system services: {e}")
+        self._network_type: Tuple[float, str] = (0.0, 'unknown')  # (monotonic time, type) of the last lookup
         self.connection_healthy = False
         self.last_successful_sync = None
+        self._last_sync_fingerprint = None  # Fingerprint of the last call list synced successfully
+
+        # Pool keep-alive connections so sync and heartbeat reuse one TLS session. Up to six
+        # requests can overlap: the app's four I/O pool workers, the scheduler thread and the
+        # upload executor. A smaller pool would drop the extra sockets after each use and pay
+        # a new handshake; keep this in step with those worker counts.
+        adapter = KeepAliveAdapter(
+            pool_connections=1,
+            pool_maxsize=6,
+            # Per-request retrying lives here: connect errors and 5xx, with exponential backoff
+            # that honours Retry-After. POST is included since the server dedupes syncs, but a
+            # read timeout (the server may already be processing the upload) is replayed at most
+            # once and a 5xx at most twice; longer outages are left to the auto sync backoff.
+            max_retries=Retry(
+                total=5,
+                read=1,
+                status=2,
+                backoff_factor=1.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'HEAD', 'POST']),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-        # Configure session with aggressive timeouts and retries
-        self.session.timeout = 45
+        # Default headers shared by every request on the pooled session
         self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip',
             'Content-Type': 'application/json',
             'X-Python-App': 'true',
             'X-Platform': 'Android',
@@ -422,101 +787,114 @@ class BackendAPI:
             'User-Agent': 'KortahunUnited-PythonApp/2.0.0'
         })
 
+    def set_device_id(self, device_id: Optional[str]):
+        """Set the device ID, touching the session's default headers only when it changes"""
+        if device_id == self.device_id:
+            return
+
+        self.device_id = device_id
+        self._last_sync_fingerprint = None
+        if device_id:
+            self.session.headers['X-Device-ID'] = device_id
+        else:
+            self.session.headers.pop('X-Device-ID', None)
+
     def test_connection(self) -> Dict[str, Any]:
-        """Test connection with retry logic"""
-        for attempt in range(3):
-            try:
-                self.logger.info(f"Testing backend connection (attempt {attempt + 1})...")
-                response = self.session.get(f"{self.api_base}/health", timeout=20)
+        """Test connection; transient failures are retried by the session's transport"""
+        try:
+            self.logger.info("Testing backend connection...")
+            response = self.session.get(f"{self.api_base}/health", timeout=(self.CONNECT_TIMEOUT, 20))
+
+            if response.status_code == 200:
+                data = loads_json(response.content)
+                self.connection_healthy = True
+                self.logger.info("✅ Backend connection successful")
+                return {
+                    'success': True,
+                    'status': 'connected',
+                    'server_status': data.get('status', 'unknown'),
+                    'python_app_ready': data.get('pythonAppReady', False),
+                    'message': 'Successfully connected to Kortahun United server'
+                }
 
-                if response.status_code == 200:
-                    data = response.json()
-                    self.connection_healthy = True
-                    self.logger.info("✅ Backend connection successful")
-                    return {
-                        'success': True,
-                        'status': 'connected',
-                        'server_status': data.get('status', 'unknown'),
-                        'python_app_ready': data.get('pythonAppReady', False),
-                        'message': 'Successfully connected to Kortahun United server'
-                    }
-                else:
-                    self.connection_healthy = False
+            self.logger.warning("Connection test failed: HTTP %d", response.status_code)
 
-            except Exception as e:
-                self.logger.error(f"Connection test attempt {attempt + 1} failed: {e}")
-                if attempt < 2:  # Not the last attempt
-                    time.sleep(2)  # Wait before retry
-                    continue
+        except Exception as e:
+            self.logger.error(f"Connection test failed: {e}")
 
         self.connection_healthy = False
         return {
             'success': False,
             'status': 'connection_failed',
             'error': 'All connection attempts failed',
-            'message': 'Could not connect to server after 3 attempts'
+            'message': 'Could not connect to server after retries'
         }
 
+    def prewarm_connection(self):
+        """Open a pooled keep-alive connection (DNS + TCP + TLS) ahead of the first real request"""
+        try:
+            self.session.head(self.base_url, timeout=(5, 5))
+            self.logger.info("Backend connection pre-warmed")
+        except Exception as e:
+            self.logger.warning("Connection pre-warm failed: %s", e)
+
     def register_device_from_qr(self, qr_data: str) -> Dict[str, Any]:
         """Enhanced device registration with validation and retry"""
-        for attempt in range(3):  # Retry registration up to 3 times
-            try:
-                self.logger.info(f"Registering device (attempt {attempt + 1}): {qr_data[:50]}...")
+        self.logger.info(f"Registering device: {qr_data[:50]}...")
 
-                # Validate QR data format
-                if not qr_data or not qr_data.startswith('http'):
-                    return {
-                        'success': False,
-                        'error': 'Invalid QR code format',
-                        'message': 'QR code should contain a valid URL starting with http'
-                    }
+        # Validate QR data format
+        if not qr_data or not qr_data.startswith('http'):
+            return {
+                'success': False,
+                'error': 'Invalid QR code format',
+                'message': 'QR code should contain a valid URL starting with http'
+            }
 
-                # Parse the QR URL to extract the token
-                parsed_url = urlparse(qr_data)
-                path_parts = parsed_url.path.split('/')
+        # Parse the QR URL to extract the token
+        parsed_url = urlparse(qr_data)
+        path_parts = parsed_url.path.rstrip('/').split('/')  # Tolerate a trailing slash
 
-                if len(path_parts) < 5 or path_parts[-2] != 'connect':
-                    return {
-                        'success': False,
-                        'error': 'Invalid QR URL format',
-                        'message': 'QR code URL does not contain valid connection token path'
-                    }
+        if len(path_parts) < 5 or path_parts[-2] != 'connect':
+            return {
+                'success': False,
+                'error': 'Invalid QR URL format',
+                'message': 'QR code URL does not contain valid connection token path'
+            }
 
-                connection_token = path_parts[-1]
+        connection_token = path_parts[-1]
 
-                # Validate token format
-                if not re.match(r'^[a-f0-9]{64}$', connection_token, re.IGNORECASE):
-                    return {
-                        'success': False,
-                        'error': 'Invalid connection token',
-                        'message': f'Token format is invalid: {connection_token[:16]}...'
-                    }
+        # Validate token format
+        if not self.TOKEN_PATTERN.match(connection_token):
+            return {
+                'success': False,
+                'error': 'Invalid connection token',
+                'message': f'Token format is invalid: {connection_token[:16]}...'
+            }
 
-                self.logger.info(f"Extracted token: {connection_token[:16]}...")
+        self.logger.info(f"Extracted token: {connection_token[:16]}...")
 
-                # Make registration request
-                headers = {
-                    **self.session.headers,
-                    'X-Device-Token': connection_token,
-                    'X-Registration-Method': 'qr_code_scan',
-                    'X-Registration-Attempt': str(attempt + 1)
-                }
+        # HTTP-level failures are retried by the transport; this loop only retries a 200 whose
+        # body reports the registration as not (yet) accepted
+        headers = {
+            'X-Device-Token': connection_token,
+            'X-Registration-Method': 'qr_code_scan'
+        }
+        for attempt in range(2):
+            try:
+                headers['X-Registration-Attempt'] = str(attempt + 1)
 
-                response = self.session.get(qr_data, headers=headers, timeout=45)
+                response = self.session.get(qr_data, headers=headers, timeout=(self.CONNECT_TIMEOUT, 45))
                 self.logger.info(f"Registration response: {response.status_code}")
 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = loads_json(response.content)
 
                     if data.get('success') and data.get('deviceRegistered', False):
                         # Extract device information
                         device_info = data.get('device', {})
-                        self.device_id = device_info.get('deviceId')
+                        self.set_device_id(device_info.get('deviceId'))
                         self.device_name = device_info.get('deviceName', f'Device {self.device_id}')
 
-                        # Update session headers
-                        self.session.headers.update({'X-Device-ID': self.device_id})
-
                         self.logger.info(f"✅ Device registered successfully: {self.device_id}")
                         return {
                             'success': True,
@@ -527,19 +905,18 @@ class BackendAPI:
                             'heartbeat_endpoint': f"{self.api_base}/devices/device/{self.device_id}/heartbeat",
                             'message': f'Device registered successfully as {self.device_name}!'
                         }
-                    else:
-                        error_msg = data.get('message', 'Registration failed - server rejected request')
-                        if attempt < 2:  # Not the last attempt
-                            self.logger.warning(f"Registration attempt {attempt + 1} rejected, retrying...")
-                            time.sleep(2)
-                            continue
 
-                        return {
-                            'success': False,
-                            'error': 'Registration failed',
-                            'message': error_msg,
-                            'response_data': data
-                        }
+                    if attempt == 0:
+                        self.logger.warning("Registration rejected, retrying once...")
+                        time.sleep(2)
+                        continue
+
+                    return {
+                        'success': False,
+                        'error': 'Registration failed',
+                        'message': data.get('message', 'Registration failed - server rejected request'),
+                        'response_data': data
+                    }
 
                 elif response.status_code == 404:
                     return {
@@ -549,13 +926,8 @@ class BackendAPI:
                         'token': connection_token[:16] + '...'
                     }
                 else:
-                    if attempt < 2:  # Not the last attempt
-                        self.logger.warning(f"HTTP {response.status_code} on attempt {attempt + 1}, retrying...")
-                        time.sleep(2)
-                        continue
-
                     try:
-                        error_data = response.json()
+                        error_data = loads_json(response.content)
                         error_msg = error_data.get('message', f'HTTP {response.status_code}')
                     except:
                         error_msg = f'HTTP {response.status_code}'
@@ -568,18 +940,21 @@ class BackendAPI:
                     }
 
             except Exception as e:
-                self.logger.error(f"Registration attempt {attempt + 1} error: {e}")
-                if attempt < 2:  # Not the last attempt
-                    time.sleep(3)  # Wait longer between attempts
-                    continue
+                self.logger.error(f"Registration error: {e}")
+                break
 
         return {
             'success': False,
             'error': 'Registration failed after retries',
-            'message': 'Device registration failed after 3 attempts'
+            'message': 'Device registration failed after retries'
         }
 
-    def sync_calls(self, calls: List[Dict[str, Any]], force: bool = False) -> Dict[str, Any]:
+    def sync_calls_batch(self, calls: List[Dict[str, Any]], batch_index: int) -> Dict[str, Any]:
+        """Sync one batch of a larger, streamed upload"""
+        return self.sync_calls(calls, force=True, batch_info={'batchIndex': batch_index, 'batchSize': len(calls)})
+
+    def sync_calls(self, calls: List[Dict[str, Any]], force: bool = False,
+                   batch_info: Dict[str, Any] = None) -> Dict[str, Any]:
         """Enhanced call sync with retry logic and aggressive sending"""
         if not self.device_id:
             return {
@@ -595,172 +970,353 @@ class BackendAPI:
                 'message': 'No calls to sync'
             }
 
-        # Multiple retry attempts for sync
-        for attempt in range(5):  # More aggressive retry for sync
-            try:
-                self.logger.info(f"Syncing {len(calls)} calls (attempt {attempt + 1})...")
-
-                payload = {
-                    'calls': calls,
-                    'syncMetadata': {
-                        'attempt': attempt + 1,
-                        'timestamp': datetime.now().isoformat(),
-                        'callCount': len(calls),
-                        'forced': force,
-                        'appVersion': '2.0.0'
-                    }
-                }
+        # Same calls as the last successful sync: nothing for the server to do
+        fingerprint = self._calls_fingerprint(calls)
+        if not force and fingerprint == self._last_sync_fingerprint:
+            self.logger.info("Skipping sync: %d calls unchanged since last successful sync", len(calls))
+            return {
+                'success': True,
+                'synced_count': 0,
+                'duplicate_count': len(calls),
+                'skipped': True,
+                'message': 'No changes since last sync'
+            }
 
-                url = f"{self.api_base}/calls/sync/{self.device_id}"
+        # Upload in fixed-size chunks so each request body stays small
+        chunk_count = (len(calls) + self.SYNC_CHUNK_SIZE - 1) // self.SYNC_CHUNK_SIZE
+        totals = {'synced_count': 0, 'duplicate_count': 0, 'error_count': 0}
+        result = None
 
-                headers = {
-                    **self.session.headers,
-                    'X-Device-ID': self.device_id,
-                    'X-Sync-Call-Count': str(len(calls)),
-                    'X-Sync-Timestamp': datetime.now().isoformat(),
-                    'X-Sync-Attempt': str(attempt + 1)
-                }
+        for chunk_index in range(chunk_count):
+            start = chunk_index * self.SYNC_CHUNK_SIZE
+            chunk = calls[start:start + self.SYNC_CHUNK_SIZE]
+            chunk_info = dict(batch_info or {})
+            if chunk_count > 1:
+                chunk_info.update({'chunkIndex': chunk_index, 'chunkCount': chunk_count})
 
-                response = self.session.post(url, json=payload, headers=headers, timeout=120)
+            result = self._sync_chunk(chunk, force, chunk_info)
+            if not result['success']:
+                self._last_sync_fingerprint = None
+                return result
 
-                if response.status_code in [200, 207]:
-                    data = response.json()
-                    sync_metrics = data.get('syncMetrics', {})
+            for key in totals:
+                totals[key] += result.get(key, 0)
 
-                    self.last_successful_sync = datetime.now()
-                    self.connection_healthy = True
+        self._last_sync_fingerprint = fingerprint
+        return {
+            **result,
+            **totals,
+            'message': f"Successfully synced {totals['synced_count']} calls"
+        }
 
-                    synced_count = sync_metrics.get('syncedCount', 0)
-                    self.logger.info(f"✅ Sync completed (attempt {attempt + 1}): {synced_count} synced")
+    def _calls_fingerprint(self, calls: List[Dict[str, Any]]) -> bytes:
+        """Digest of the identifying fields of each call (per-fetch metadata like extractedAt is ignored)"""
+        digest = hashlib.sha256()
+        for call in calls:
+            digest.update(f"{call.get('contactId')}|{call.get('timestamp')}|{call.get('phoneNumber')}|"
+                          f"{call.get('callType')}|{call.get('duration')}\n".encode('utf-8'))
+        return digest.digest()
+
+    def build_sync_request(self, calls: List[Dict[str, Any]], force: bool,
+                           batch_info: Dict[str, Any]) -> Tuple[str, Dict[str, str], bytes]:
+        """Build the (url, headers, gzip body) for one sync POST"""
+        sync_metadata = {
+            'timestamp': datetime.now().isoformat(),
+            'callCount': len(calls),
+            'forced': force,
+            'appVersion': '2.0.0',
+            **batch_info
+        }
+        body = self._gzip_sync_payload(calls, sync_metadata)
 
-                    return {
-                        'success': True,
-                        'synced_count': synced_count,
-                        'duplicate_count': sync_metrics.get('duplicateCount', 0),
-                        'error_count': sync_metrics.get('errorCount', 0),
-                        'success_rate': sync_metrics.get('successRate', 'N/A'),
-                        'message': f"Successfully synced {synced_count} calls"
-                    }
-                else:
-                    self.logger.warning(f"Sync attempt {attempt + 1} failed: HTTP {response.status_code}")
-                    if attempt < 4:  # Not the last attempt
-                        wait_time = (attempt + 1) * 2  # Progressive backoff
-                        time.sleep(wait_time)
-                        continue
+        url = f"{self.api_base}/calls/sync/{self.device_id}"
 
-            except Exception as e:
-                self.logger.error(f"Sync attempt {attempt + 1} error: {e}")
-                if attempt < 4:  # Not the last attempt
-                    wait_time = (attempt + 1) * 3  # Progressive backoff
-                    time.sleep(wait_time)
-                    continue
+        # Only per-request headers; requests merges in the session defaults (incl. X-Device-ID)
+        headers = {
+            'X-Sync-Call-Count': str(len(calls)),
+            'X-Sync-Timestamp': datetime.now().isoformat(),
+            'Content-Encoding': 'gzip'
+        }
+
+        return url, headers, body
+
+    def _gzip_sync_payload(self, calls: List[Dict[str, Any]], sync_metadata: Dict[str, Any]) -> bytes:
+        """Encode {"calls": [...], "syncMetadata": {...}} straight into gzip, one call at a time
+
+        The uncompressed JSON document is never held in memory; only the (much smaller)
+        compressed body is, which stays a plain bytes object so transport retries can resend it.
+        """
+        compressor = zlib.compressobj(self.GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip framing
+        parts = [compressor.compress(b'{"calls":[')]
+        for index, call in enumerate(calls):
+            encoded = dumps_json(call)
+            parts.append(compressor.compress(b',' + encoded if index else encoded))
+        parts.append(compressor.compress(b'],"syncMetadata":' + dumps_json(sync_metadata) + b'}'))
+        parts.append(compressor.flush())
+        return b''.join(parts)
+
+    def _sync_chunk(self, calls: List[Dict[str, Any]], force: bool,
+                    batch_info: Dict[str, Any]) -> Dict[str, Any]:
+        """POST one chunk of calls (gzip-compressed); retries happen in the transport"""
+        try:
+            self.logger.info("Syncing %d calls...", len(calls))
+
+            url, headers, body = self.build_sync_request(calls, force, batch_info)
+            response = self.session.post(url, data=body, headers=headers, timeout=(self.CONNECT_TIMEOUT, 60))
+
+            if response.status_code in [200, 207]:
+                data = loads_json(response.content)
+                sync_metrics = data.get('syncMetrics', {})
+
+                self.last_successful_sync = datetime.now()
+                self.connection_healthy = True
+
+                synced_count = sync_metrics.get('syncedCount', 0)
+                self.logger.info("Sync completed: %d synced", synced_count)
+
+                return {
+                    'success': True,
+                    'synced_count': synced_count,
+                    'duplicate_count': sync_metrics.get('duplicateCount', 0),
+                    'error_count': sync_metrics.get('errorCount', 0),
+                    'success_rate': sync_metrics.get('successRate', 'N/A'),
+                    'message': f"Successfully synced {synced_count} calls"
+                }
+
+            self.logger.warning("Sync failed: HTTP %s", response.status_code)
+
+        except Exception as e:
+            self.logger.error("Sync error: %s", e)
 
-        # All attempts failed
         self.connection_healthy = False
         return {
             'success': False,
             'error': 'Sync failed after retries',
-            'message': 'Call sync failed after 5 attempts'
+            'message': 'Call sync failed after retries'
         }
 
+    def build_heartbeat_request(self, status_data: Optional[Dict[str, Any]]) -> Tuple[str, bytes]:
+        """Build the (url, encoded JSON body) for one heartbeat POST"""
+        url = f"{self.api_base}/devices/device/{self.device_id}/heartbeat"
+
+        heartbeat_data = {
+            'timestamp': datetime.now().isoformat(),
+            'status': 'active',
+            'appVersion': '2.0.0',
+            'permissions': {
+                'callLog': ANDROID_AVAILABLE,
+                'phone': ANDROID_AVAILABLE,
+                'storage': True,
+                'camera': SCANNER_AVAILABLE
+            },
+            'batteryLevel': self._get_battery_level(),
+            'networkType': self._get_network_type(),
+            'lastCallSync': self.last_successful_sync.isoformat() if self.last_successful_sync else None,
+            'connectionHealthy': self.connection_healthy,
+            **(status_data or {})
+        }
+
+        return url, dumps_json(heartbeat_data)
+
     def send_heartbeat(self, status_data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send heartbeat with retry logic"""
+        """Send heartbeat; transient failures are retried by the session's transport"""
         if not self.device_id:
             return {'success': False, 'message': 'Device not registered'}
 
-        for attempt in range(3):
-            try:
-                url = f"{self.api_base}/devices/device/{self.device_id}/heartbeat"
-
-                heartbeat_data = {
-                    'timestamp': datetime.now().isoformat(),
-                    'status': 'active',
-                    'appVersion': '2.0.0',
-                    'permissions': {
-                        'callLog': ANDROID_AVAILABLE,
-                        'phone': ANDROID_AVAILABLE,
-                        'storage': True,
-                        'camera': SCANNER_AVAILABLE
-                    },
-                    'batteryLevel': self._get_battery_level(),
-                    'networkType': self._get_network_type(),
-                    'lastCallSync': self.last_successful_sync.isoformat() if self.last_successful_sync else None,
-                    'connectionHealthy': self.connection_healthy,
-                    'heartbeatAttempt': attempt + 1,
-                    **(status_data or {})
+        try:
+            url, body = self.build_heartbeat_request(status_data)
+            response = self.session.post(url, data=body, timeout=(self.CONNECT_TIMEOUT, 30))
+
+            if response.status_code == 200:
+                self.connection_healthy = True
+                return {
+                    'success': True,
+                    'message': 'Heartbeat sent successfully',
+                    'server_instructions': loads_json(response.content).get('serverInstructions', {})
                 }
 
-                response = self.session.post(url, json=heartbeat_data, timeout=30)
+            self.logger.warning("Heartbeat failed: HTTP %s", response.status_code)
 
-                if response.status_code == 200:
-                    self.connection_healthy = True
-                    return {
-                        'success': True,
-                        'message': 'Heartbeat sent successfully',
-                        'server_instructions': response.json().get('serverInstructions', {})
-                    }
-                else:
-                    if attempt < 2:
-                        time.sleep(2)
-                        continue
-
-            except Exception as e:
-                self.logger.error(f"Heartbeat attempt {attempt + 1} error: {e}")
-                if attempt < 2:
-                    time.sleep(2)
-                    continue
+        except Exception as e:
+            self.logger.error("Heartbeat error: %s", e)
 
         self.connection_healthy = False
         return {
             'success': False,
             'error': 'Heartbeat failed after retries',
-            'message': 'Heartbeat failed after 3 attempts'
+            'message': 'Heartbeat failed after retries'
         }
 
     def _get_battery_level(self) -> int:
         """Get battery level"""
         if ANDROID_AVAILABLE:
             try:
-                activity = PythonActivity.mActivity
-                context = activity.getApplicationContext()
-                battery_manager = context.getSystemService(Context.BATTERY_SERVICE)
+                battery_manager = self._battery_manager
                 if battery_manager:
                     return int(battery_manager.getIntProperty(4))
             except Exception:
                 pass
         return -1
 
+    def is_network_available(self) -> bool:
+        """Cheap check for an active network with internet capability (assumes online off-Android)"""
+        if ANDROID_AVAILABLE:
+            try:
+                connectivity_manager = self._connectivity_manager
+                if connectivity_manager:
+                    active_network = connectivity_manager.getActiveNetwork()
+                    if not active_network:
+                        return False
+                    network_capabilities = connectivity_manager.getNetworkCapabilities(active_network)
+                    return bool(network_capabilities and
+                                network_capabilities.hasCapability(NetworkCapabilities.NET_CAPABILITY_INTERNET))
+            except Exception:
+                pass
+        return True
+
     def _get_network_type(self) -> str:
-        """Get network type"""
+        """Get network type, reusing a lookup made within NETWORK_TYPE_TTL seconds"""
+        checked_at, network_type = self._network_type
+        if time.monotonic() - checked_at < self.NETWORK_TYPE_TTL:
+            return network_type
+
+        network_type = 'unknown'
         if ANDROID_AVAILABLE:
             try:
-                activity = PythonActivity.mActivity
-                context = activity.getApplicationContext()
-                connectivity_manager = context.getSystemService(Context.CONNECTIVITY_SERVICE)
+                connectivity_manager = self._connectivity_manager
                 if connectivity_manager:
                     active_network = connectivity_manager.getActiveNetwork()
                     if active_network:
                         network_capabilities = connectivity_manager.getNetworkCapabilities(active_network)
                         if network_capabilities:
-                            if network_capabilities.hasTransport(1):
-                                return 'wifi'
-                            elif network_capabilities.hasTransport(0):
-                                return 'cellular'
+                            if network_capabilities.hasTransport(NetworkCapabilities.TRANSPORT_WIFI):
+                                network_type = 'wifi'
+                            elif network_capabilities.hasTransport(NetworkCapabilities.TRANSPORT_CELLULAR):
+                                network_type = 'cellular'
             except Exception:
                 pass
-        return 'unknown'
 
+        self._network_type = (time.monotonic(), network_type)
+        return network_type
+
+
+@lru_cache(maxsize=4096)
+def format_call_time(timestamp_str: str) -> str:
+    """Short display time for a call's ISO timestamp; memoized since rows repeat across renders"""
+    # Fast path for the YYYY-MM-DDTHH:MM... shape _format_timestamp produces: the display
+    # string is just those fields rearranged, so no datetime needs to be built
+    if (len(timestamp_str) >= 16 and timestamp_str[4] == '-' and timestamp_str[7] == '-'
+            and timestamp_str[10] == 'T' and timestamp_str[13] == ':'):
+        return f"{timestamp_str[5:7]}/{timestamp_str[8:10]} {timestamp_str[11:16]}"
+
+    try:
+        if timestamp_str:
+            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+            return dt.strftime('%m/%d %H:%M')
+    except Exception:
+        pass
+    return 'Unknown time'
+
+
+@lru_cache(maxsize=4)
+def format_registration_time(timestamp_str: Optional[str]) -> str:
+    """Display form of the stored registration time; memoized since it only changes on re-registration"""
+    if not timestamp_str:
+        return 'Never'
+    try:
+        return datetime.fromisoformat(timestamp_str).strftime('%Y-%m-%d %H:%M')
+    except ValueError:
+        return 'Unknown'
+
+
+@lru_cache(maxsize=512)
+def format_call_duration(duration: int, unanswered: bool) -> str:
+    """Human-readable call duration; memoized since short durations repeat constantly"""
+    if duration <= 0:
+        return "No answer" if unanswered else "0s"
+    minutes, seconds = divmod(duration, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes}m {seconds}s"
+    if minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+@lru_cache(maxsize=64)
+def iso_to_epoch(timestamp_str: str) -> float:
+    """Epoch seconds of an ISO timestamp; memoized since the same value is re-read on every refresh"""
+    return datetime.fromisoformat(timestamp_str).timestamp()
+
+
+def throttle(interval: float):
+    """Run a main-thread method at most once per interval
+
+    Calls that arrive sooner collapse into one trailing call with the latest
+    arguments, so the last update is never lost.
+    """
+    def decorator(func):
+        state_attr = f"_{func.__name__}_throttle"
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            state = self.__dict__.setdefault(state_attr, {'last': 0.0, 'event': None, 'args': None})
+            wait = state['last'] + interval - time.monotonic()
+            if wait <= 0 and state['event'] is None:
+                state['last'] = time.monotonic()
+                func(self, *args, **kwargs)
+                return
 
-class CallCard(MDCard):
-    """Enhanced call card with better visibility and real-time updates"""
+            state['args'] = (args, kwargs)
+            if state['event'] is None:
+                def run_trailing(dt):
+                    trailing_args, trailing_kwargs = state['args']
+                    state['event'] = state['args'] = None
+                    state['last'] = time.monotonic()
+                    func(self, *trailing_args, **trailing_kwargs)
+
+                state['event'] = Clock.schedule_once(run_trailing, max(wait, 0))
+
+        return wrapper
+    return decorator
+
+
+class CallCard(RecycleDataViewBehavior, MDCard):
+    """Recycled call card; child widgets are built once and refreshed from view data"""
+
+    BG_COLORS = {
+        'missed': (1, 0.9, 0.9, 1),  # Light red
+        'incoming': (0.9, 1, 0.9, 1),  # Light green
+        'outgoing': (0.9, 0.9, 1, 1)  # Light blue
+    }
+    DEFAULT_BG_COLOR = (0.95, 0.95, 0.95, 1)  # Light gray
+    ICONS = {
+        'incoming': 'phone-incoming',
+        'outgoing': 'phone-outgoing',
+        'missed': 'phone-missed',
+        'rejected': 'phone-hangup',
+        'blocked': 'phone-cancel'
+    }
+    ICON_COLORS = {
+        'incoming': (0.2, 0.8, 0.2, 1),  # Bright green
+        'outgoing': (0.2, 0.2, 0.8, 1),  # Bright blue
+        'missed': (0.8, 0.2, 0.2, 1),  # Bright red
+        'rejected': (1, 0.5, 0, 1),  # Orange
+        'blocked': (0.6, 0.1, 0.1, 1)  # Dark red
+    }
+    DEFAULT_ICON_COLOR = (0.5, 0.5, 0.5, 1)
+    UNANSWERED_TYPES = frozenset(('missed', 'rejected'))
 
-    def __init__(self, call_data: Dict[str, Any], **kwargs):
+    def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.call_data = call_data
+        self.icon = None
+        self.name_label = None
+        self.phone_label = None
+        self.time_label = None
         self.setup_ui()
 
     def setup_ui(self):
-        """Setup enhanced call card UI"""
+        """Build the card's widgets once; refresh_view_attrs fills them in"""
         self.size_hint_y = None
         self.height = dp(90)
         self.padding = dp(16)
@@ -768,18 +1324,6 @@ class CallCard(MDCard):
         self.elevation = 3
         self.radius = [dp(8)]
 
-        # Color coding based on call type
-        call_type = self.call_data.get('callType', 'unknown')
-
-        if call_type == 'missed':
-            self.md_bg_color = (1, 0.9, 0.9, 1)  # Light red
-        elif call_type == 'incoming':
-            self.md_bg_color = (0.9, 1, 0.9, 1)  # Light green
-        elif call_type == 'outgoing':
-            self.md_bg_color = (0.9, 0.9, 1, 1)  # Light blue
-        else:
-            self.md_bg_color = (0.95, 0.95, 0.95, 1)  # Light gray
-
         # Main layout
         main_layout = MDBoxLayout(
             orientation='horizontal',
@@ -787,26 +1331,9 @@ class CallCard(MDCard):
         )
 
         # Call type icon with better visibility
-        icon_name = {
-            'incoming': 'phone-incoming',
-            'outgoing': 'phone-outgoing',
-            'missed': 'phone-missed',
-            'rejected': 'phone-hangup',
-            'blocked': 'phone-cancel'
-        }.get(call_type, 'phone')
-
-        icon_color = {
-            'incoming': (0.2, 0.8, 0.2, 1),  # Bright green
-            'outgoing': (0.2, 0.2, 0.8, 1),  # Bright blue
-            'missed': (0.8, 0.2, 0.2, 1),  # Bright red
-            'rejected': (1, 0.5, 0, 1),  # Orange
-            'blocked': (0.6, 0.1, 0.1, 1)  # Dark red
-        }.get(call_type, (0.5, 0.5, 0.5, 1))
-
-        icon = MDIconButton(
-            icon=icon_name,
+        self.icon = MDIconButton(
+            icon='phone',
             theme_icon_color='Custom',
-            icon_color=icon_color,
             size_hint=(None, None),
             size=(dp(40), dp(40))
         )
@@ -818,9 +1345,7 @@ class CallCard(MDCard):
         )
 
         # Contact name or phone number (larger text)
-        contact_name = self.call_data.get('contactName') or self.call_data.get('phoneNumber', 'Unknown')
-        name_label = MDLabel(
-            text=contact_name,
+        self.name_label = MDLabel(
             font_style='Subtitle1',
             theme_text_color='Primary',
             size_hint_y=None,
@@ -828,66 +1353,73 @@ class CallCard(MDCard):
             bold=True
         )
 
-        # Phone number if different from name
-        phone_number = self.call_data.get('phoneNumber', '')
-        if self.call_data.get('contactName') and phone_number != contact_name:
-            phone_label = MDLabel(
-                text=phone_number,
-                font_style='Body2',
-                theme_text_color='Secondary',
-                size_hint_y=None,
-                height=dp(16)
-            )
-            info_layout.add_widget(phone_label)
-
-        # Time and duration info
-        timestamp_str = self.call_data.get('timestamp', '')
-        try:
-            if timestamp_str:
-                dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                time_str = dt.strftime('%m/%d %H:%M')
-            else:
-                time_str = 'Unknown time'
-        except Exception:
-            time_str = 'Unknown time'
-
-        duration = self.call_data.get('duration', 0)
-        if duration > 0:
-            if duration >= 3600:  # More than 1 hour
-                hours = duration // 3600
-                minutes = (duration % 3600) // 60
-                seconds = duration % 60
-                duration_str = f"{hours}h {minutes}m {seconds}s"
-            elif duration >= 60:
-                minutes = duration // 60
-                seconds = duration % 60
-                duration_str = f"{minutes}m {seconds}s"
-            else:
-                duration_str = f"{duration}s"
-        else:
-            duration_str = "No answer" if call_type in ['missed', 'rejected'] else "0s"
-
-        # Status indicator
-        sync_status = "✅ Synced" if self.call_data.get('synced') else "⏳ Pending"
-        time_info = f"{time_str} • {duration_str} • {sync_status}"
+        # Phone number if different from name; left empty otherwise
+        self.phone_label = MDLabel(
+            font_style='Body2',
+            theme_text_color='Secondary',
+            size_hint_y=None,
+            height=dp(16)
+        )
 
-        time_label = MDLabel(
-            text=time_info,
+        self.time_label = MDLabel(
             font_style='Caption',
             theme_text_color='Secondary',
             size_hint_y=None,
             height=dp(16)
         )
 
-        # Add widgets to layouts
-        info_layout.add_widget(name_label)
-        info_layout.add_widget(time_label)
+        info_layout.add_widget(self.phone_label)
+        info_layout.add_widget(self.name_label)
+        info_layout.add_widget(self.time_label)
 
-        main_layout.add_widget(icon)
+        main_layout.add_widget(self.icon)
         main_layout.add_widget(info_layout)
 
         self.add_widget(main_layout)
 
+    def refresh_view_attrs(self, rv, index, data):
+        """Update the existing widgets in place from a view_data() dict"""
+        self.md_bg_color = data['bg_color']
+        self.icon.icon = data['icon']
+        self.icon.icon_color = data['icon_color']
+        self.name_label.text = data['name']
+        self.phone_label.text = data['phone']
+        self.time_label.text = data['info']
+
+    @staticmethod
+    def display_key(call_data: Dict[str, Any]) -> Tuple:
+        """The fields view_data() reads; equal keys render identical cards"""
+        return (call_data.get('callType'), call_data.get('contactName'), call_data.get('phoneNumber'),
+                call_data.get('timestamp'), call_data.get('duration'), call_data.get('synced'))
+
+    @classmethod
+    def view_data(cls, call_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a call dict into the display values the recycled card shows"""
+        call_type = call_data.get('callType', 'unknown')
+
+        # Contact name or phone number, plus the number when a name is shown
+        contact_name = call_data.get('contactName') or call_data.get('phoneNumber', 'Unknown')
+        phone_number = call_data.get('phoneNumber', '')
+        if not (call_data.get('contactName') and phone_number != contact_name):
+            phone_number = ''
+
+        # Time and duration info
+        time_str = format_call_time(call_data.get('timestamp', ''))
+
+        duration_str = format_call_duration(call_data.get('duration', 0), call_type in cls.UNANSWERED_TYPES)
+
+        # Status indicator
+        sync_status = "✅ Synced" if call_data.get('synced') else "⏳ Pending"
+
+        return {
+            'bg_color': cls.BG_COLORS.get(call_type, cls.DEFAULT_BG_COLOR),
+            'icon': cls.ICONS.get(call_type, 'phone'),
+            'icon_color': cls.ICON_COLORS.get(call_type, cls.DEFAULT_ICON_COLOR),
+            'name': contact_name,
+            'phone': phone_number,
+            'info': f"{time_str} • {duration_str} • {sync_status}"
+        }
+
 
 class StatusCard(MDCard):
     """Enhanced status card with real-time updates and better visibility"""
@@ -898,6 +1430,7 @@ class StatusCard(MDCard):
         self.value = value
         self.icon = icon
         self.value_label = None
+        self._last_color = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -954,7 +1487,12 @@ class StatusCard(MDCard):
 
     def update_value(self, new_value: str, color=None):
         """Update card value with optional color"""
+        # Skip identical updates to avoid redundant property dispatches
+        if new_value == self.value and color == self._last_color:
+            return
+
         self.value = new_value
+        self._last_color = color
         if self.value_label:
             self.value_label.text = str(new_value)
             if color:
@@ -973,14 +1511,19 @@ class MainScreen(MDScreen):
         self.sync_status_card = None
         self.calls_count_card = None
         self.device_status_card = None
-        self.calls_scroll = None
-        self.calls_list = None
+        self.calls_rv = None
+        self.no_calls_card = None
         self.refresh_button = None
-        self.last_displayed_calls = []
+        self.auto_sync_button = None
+        self._last_displayed_count = 0
+        self._showing_calls = None  # Whether the list (True) or the placeholder (False) is shown
+        self._no_calls_height = dp(60)  # Resolved once; the placeholder toggles on every empty/non-empty flip
+        self._last_calls_sig = None  # Content signature of the last polled call list
+        self._last_display_sig = None  # display_key() of each call currently in the RecycleView
+        self._last_status_tuple = None
         self.setup_ui()
 
-        # Aggressive UI update schedule
-        Clock.schedule_interval(self.update_ui, 10)  # Update every 10 seconds
+        # Connection is probed on start/resume and before manual syncs, not on a timer
         Clock.schedule_interval(self.check_for_new_calls, 5)  # Check for new calls every 5 seconds
 
     def setup_ui(self):
@@ -995,7 +1538,7 @@ class MainScreen(MDScreen):
         app_bar = MDTopAppBar(
             title="Kortahun United - Call Tracker",
             elevation=3,
-            left_action_items=[["menu", lambda x: self.app.open_settings()]],
+            left_action_items=[["menu", lambda x: self.app.go_to_settings()]],
             right_action_items=[
                 ["refresh", lambda x: self.force_refresh()],
                 ["sync", lambda x: self.manual_sync()],
@@ -1048,16 +1591,33 @@ class MainScreen(MDScreen):
         calls_header_layout.add_widget(calls_label)
         calls_header_layout.add_widget(self.live_indicator)
 
-        # Enhanced scrollable call list
-        self.calls_scroll = MDScrollView()
-        self.calls_list = MDBoxLayout(
+        # Placeholder shown instead of the list when there are no calls
+        self.no_calls_card = MDCard(
+            size_hint_y=None,
+            height=dp(0),
+            opacity=0,
+            padding=dp(16),
+            elevation=1,
+            radius=[dp(8)]
+        )
+        self.no_calls_card.add_widget(MDLabel(
+            text="No calls found" if ANDROID_AVAILABLE else "Android not available - cannot access call logs",
+            halign='center',
+            font_style='Body1',
+            theme_text_color='Secondary'
+        ))
+
+        # Recycled call list: only the visible cards exist, and they are reused on refresh
+        self.calls_rv = RecycleView(viewclass=CallCard)
+        calls_layout = RecycleBoxLayout(
             orientation='vertical',
             spacing=dp(6),
-            size_hint_y=None,
-            height=dp(0)
+            default_size=(None, dp(90)),
+            default_size_hint=(1, None),
+            size_hint_y=None
         )
-
-        self.calls_scroll.add_widget(self.calls_list)
+        calls_layout.bind(minimum_height=calls_layout.setter('height'))
+        self.calls_rv.add_widget(calls_layout)
 
         # Enhanced action buttons
         buttons_layout = MDBoxLayout(
@@ -1089,7 +1649,7 @@ class MainScreen(MDScreen):
             md_bg_color=(0.7, 0.2, 0.7, 1)
         )
 
-        auto_sync_button = MDFlatButton(
+        self.auto_sync_button = MDFlatButton(
             text="Auto: ON" if self.app.auto_sync_enabled else "Auto: OFF",
             on_release=self.toggle_auto_sync,
             size_hint_x=0.2
@@ -1098,13 +1658,14 @@ class MainScreen(MDScreen):
         buttons_layout.add_widget(sync_button)
         buttons_layout.add_widget(self.refresh_button)
         buttons_layout.add_widget(qr_button)
-        buttons_layout.add_widget(auto_sync_button)
+        buttons_layout.add_widget(self.auto_sync_button)
 
         # Add all widgets to main layout
         main_layout.add_widget(app_bar)
         main_layout.add_widget(status_layout)
         main_layout.add_widget(calls_header_layout)
-        main_layout.add_widget(self.calls_scroll)
+        main_layout.add_widget(self.no_calls_card)
+        main_layout.add_widget(self.calls_rv)
         main_layout.add_widget(buttons_layout)
 
         self.add_widget(main_layout)
@@ -1114,14 +1675,11 @@ class MainScreen(MDScreen):
 
     def initial_load(self, dt):
         """Aggressive initial data loading"""
-        threading.Thread(target=self._initial_load_thread, daemon=True).start()
+        self.app.run_in_background(self._initial_load_thread)
 
     def _initial_load_thread(self):
         """Enhanced initial loading"""
-        # Test connection immediately
-        connection_result = self.app.backend_api.test_connection()
-        Clock.schedule_once(lambda dt: self.update_connection_status(connection_result), 0)
-
+        # Connection is probed by the app's on_start handler
         # Load call logs aggressively
         self.force_refresh()
 
@@ -1144,36 +1702,35 @@ class MainScreen(MDScreen):
             self.refresh_button.text = "Refreshing..."
             self.refresh_button.disabled = True
 
-        threading.Thread(target=self._force_refresh_thread, daemon=True).start()
+        self.app.run_in_background_once(self._force_refresh_thread)
 
     def _force_refresh_thread(self):
         """Force refresh in background with aggressive data fetching"""
+        sync_msg = None
         try:
             # Get fresh call logs
             calls = self.app.call_manager.get_call_logs(limit=50, force_refresh=True)
 
-            # Update UI immediately
-            Clock.schedule_once(lambda dt: self.update_calls_display(calls), 0)
-            Clock.schedule_once(lambda dt: self.update_status_cards(calls), 0)
+            # Update UI immediately, before the network round-trip
+            self._render_calls(calls)
 
             # Trigger sync if auto-sync is enabled and device is registered
+            # Not forced: a list identical to the last successful sync is skipped without a request
             if self.app.auto_sync_enabled and self.app.backend_api.device_id and calls:
-                sync_result = self.app.backend_api.sync_calls(calls, force=True)
-                if sync_result['success']:
-                    Clock.schedule_once(
-                        lambda dt: SimpleNotification.show_message(f"Auto-synced {sync_result['synced_count']} calls"),
-                        0
-                    )
+                sync_result = self.app.backend_api.sync_calls(calls)
+                if sync_result['success'] and not sync_result.get('skipped'):
+                    sync_msg = f"Auto-synced {sync_result['synced_count']} calls"
 
         except Exception as e:
             self.app.logger.error(f"Error in force refresh: {e}")
         finally:
-            # Reset button
-            Clock.schedule_once(self._reset_refresh_button, 0)
+            self._finish_refresh(sync_msg)
 
     @mainthread
-    def _reset_refresh_button(self, dt):
-        """Reset refresh button"""
+    def _finish_refresh(self, sync_msg: Optional[str] = None):
+        """Show the sync result and reset the refresh button in one main-thread pass"""
+        if sync_msg:
+            SimpleNotification.show_message(sync_msg)
         if self.refresh_button:
             self.refresh_button.text = "Refresh"
             self.refresh_button.disabled = False
@@ -1183,162 +1740,169 @@ class MainScreen(MDScreen):
         if not ANDROID_AVAILABLE:
             return
 
-        threading.Thread(target=self._check_new_calls_thread, daemon=True).start()
+        self.app.run_in_background_once(self._check_new_calls_thread)
 
     def _check_new_calls_thread(self):
         """Check for new calls in background"""
         try:
-            current_calls = self.app.call_manager.get_call_logs(limit=10)
-
-            # Compare with last displayed calls
-            if len(current_calls) != len(self.last_displayed_calls):
-                # New calls detected
-                Clock.schedule_once(lambda dt: self.update_calls_display(current_calls), 0)
-                Clock.schedule_once(lambda dt: self.update_status_cards(current_calls), 0)
-
-                # Trigger immediate sync if enabled
-                if self.app.auto_sync_enabled and self.app.backend_api.device_id:
-                    sync_result = self.app.backend_api.sync_calls(current_calls)
-                    if sync_result['success']:
-                        Clock.schedule_once(
-                            lambda dt: SimpleNotification.show_message(
-                                f"📞 New calls synced: {sync_result['synced_count']}"),
-                            0
-                        )
+            # Only the head of the list is polled; the displayed 50 rows come from force_refresh
+            head_calls = self.app.call_manager.get_call_logs(limit=10)
+
+            # Compare content, not just the count, with the last poll; unchanged heads are ignored
+            calls_sig = hash(tuple(CallCard.display_key(c) for c in head_calls))
+            if calls_sig != self._last_calls_sig:
+                first_poll = self._last_calls_sig is None
+                self._last_calls_sig = calls_sig
+
+                # New calls detected: the regular refresh re-reads, redraws and syncs the full list.
+                # The first poll only records a baseline, since initial_load has just done that
+                if not first_poll:
+                    Clock.schedule_once(self.force_refresh)
 
         except Exception as e:
             self.app.logger.error(f"Error checking for new calls: {e}")
 
     @mainthread
+    def _render_calls(self, calls):
+        """Update the call list and status cards in a single main-thread pass"""
+        self.update_calls_display(calls)
+        self.update_status_cards(len(calls))
+
+    @throttle(0.5)
     def update_calls_display(self, calls):
         """Enhanced calls display with better visibility"""
-        # Clear existing calls
-        self.calls_list.clear_widgets()
-        self.last_displayed_calls = calls.copy()
-
-        if not calls:
-            no_calls_card = MDCard(
-                size_hint_y=None,
-                height=dp(60),
-                padding=dp(16),
-                elevation=1,
-                radius=[dp(8)]
-            )
-
-            no_calls_label = MDLabel(
-                text="No calls found" if ANDROID_AVAILABLE else "Android not available - cannot access call logs",
-                halign='center',
-                font_style='Body1',
-                theme_text_color='Secondary'
-            )
-
-            no_calls_card.add_widget(no_calls_label)
-            self.calls_list.add_widget(no_calls_card)
-            self.calls_list.height = dp(70)
-        else:
-            # Show recent calls with enhanced cards
-            recent_calls = calls[:15]  # Show more calls
-
-            for call in recent_calls:
-                call_card = CallCard(call)
-                self.calls_list.add_widget(call_card)
-
-            # Update list height
-            self.calls_list.height = len(self.calls_list.children) * dp(96)
-
-        # Update live indicator
-        self.live_indicator.icon_color = (0, 1, 0, 1) if calls else (0.5, 0.5, 0.5, 1)
-
-    @mainthread
-    def update_status_cards(self, calls):
+        # Only the count is needed later; holding no reference lets old call dicts be freed
+        self._last_displayed_count = len(calls)
+
+        # The RecycleView rebinds its existing cards to the new data; when nothing it displays
+        # changed, building and assigning identical view data is skipped
+        display_sig = tuple(CallCard.display_key(call) for call in calls[:50])
+        if display_sig != self._last_display_sig:
+            self._last_display_sig = display_sig
+            self.calls_rv.data = [CallCard.view_data(call) for call in calls[:50]]
+
+        # Placeholder and live indicator only change when the list flips between empty and non-empty
+        has_calls = bool(calls)
+        if has_calls != self._showing_calls:
+            self._showing_calls = has_calls
+            self.no_calls_card.height = 0 if has_calls else self._no_calls_height
+            self.no_calls_card.opacity = 0 if has_calls else 1
+
+            # Update live indicator
+            self.live_indicator.icon_color = (0, 1, 0, 1) if has_calls else (0.5, 0.5, 0.5, 1)
+
+    @throttle(0.5)
+    def update_status_cards(self, count: int):
         """Enhanced status cards update"""
-        # Update calls count with color
-        count = len(calls)
-        color = (0, 0.8, 0, 1) if count > 0 else (0.5, 0.5, 0.5, 1)
-        self.calls_count_card.update_value(str(count), color)
+        # Calls count with color
+        count_color = (0, 0.8, 0, 1) if count > 0 else (0.5, 0.5, 0.5, 1)
 
         # Enhanced last sync display
         try:
-            if self.app.storage.exists('app_settings'):
-                settings = self.app.storage.get('app_settings')
-                last_sync = settings.get('last_sync_time')
-                if last_sync:
-                    sync_dt = datetime.fromisoformat(last_sync)
-                    time_diff = datetime.now() - sync_dt
-
-                    if time_diff.total_seconds() < 60:
-                        sync_text = "Just now"
-                        sync_color = (0, 0.8, 0, 1)
-                    elif time_diff.total_seconds() < 3600:
-                        minutes_ago = int(time_diff.total_seconds() / 60)
-                        sync_text = f"{minutes_ago}m ago"
-                        sync_color = (0, 0.6, 0, 1) if minutes_ago < 10 else (0.8, 0.6, 0, 1)
-                    else:
-                        hours_ago = int(time_diff.total_seconds() / 3600)
-                        sync_text = f"{hours_ago}h ago"
-                        sync_color = (0.8, 0.4, 0, 1)
-
-                    self.sync_status_card.update_value(sync_text, sync_color)
+            last_sync = self.app.get_app_setting('last_sync_time')
+            if last_sync:
+                # Seconds since last sync, computed once as an integer
+                secs = int(time.time() - iso_to_epoch(last_sync))
+
+                if secs < 60:
+                    sync_text = "Just now"
+                    sync_color = (0, 0.8, 0, 1)
+                elif secs < 3600:
+                    minutes_ago = secs // 60
+                    sync_text = f"{minutes_ago}m ago"
+                    sync_color = (0, 0.6, 0, 1) if minutes_ago < 10 else (0.8, 0.6, 0, 1)
                 else:
-                    self.sync_status_card.update_value("Never", (0.8, 0, 0, 1))
+                    sync_text = f"{secs // 3600}h ago"
+                    sync_color = (0.8, 0.4, 0, 1)
             else:
-                self.sync_status_card.update_value("Never", (0.8, 0, 0, 1))
+                sync_text, sync_color = "Never", (0.8, 0, 0, 1)
         except Exception:
-            self.sync_status_card.update_value("Error", (0.8, 0, 0, 1))
+            sync_text, sync_color = "Error", (0.8, 0, 0, 1)
 
         # Enhanced device status
         try:
-            if self.app.storage.exists('device_info'):
-                device_info = self.app.storage.get('device_info')
-                device_id = device_info.get('device_id')
-                if device_id:
-                    self.device_status_card.update_value("Registered", (0, 0.8, 0, 1))
+            device_info = self.app.get_device_info()
+            if device_info:
+                if device_info.device_id:
+                    device_text, device_color = "Registered", (0, 0.8, 0, 1)
                 else:
-                    self.device_status_card.update_value("Not Registered", (0.8, 0.6, 0, 1))
+                    device_text, device_color = "Not Registered", (0.8, 0.6, 0, 1)
             else:
-                self.device_status_card.update_value("Not Registered", (0.8, 0.6, 0, 1))
+                device_text, device_color = "Not Registered", (0.8, 0.6, 0, 1)
         except Exception:
-            self.device_status_card.update_value("Error", (0.8, 0, 0, 1))
+            device_text, device_color = "Error", (0.8, 0, 0, 1)
+
+        # Skip redundant property writes (and redraws) when nothing changed
+        snapshot = (count, sync_text, sync_color, device_text, device_color)
+        if snapshot == self._last_status_tuple:
+            return
+        self._last_status_tuple = snapshot
+
+        self.calls_count_card.update_value(str(count), count_color)
+        self.sync_status_card.update_value(sync_text, sync_color)
+        self.device_status_card.update_value(device_text, device_color)
 
     def manual_sync(self, *args):
         """Enhanced manual sync with better feedback"""
         SimpleNotification.show_info("Starting manual sync...")
-        threading.Thread(target=self._manual_sync_thread, daemon=True).start()
+        self.app.run_in_background(self._manual_sync_thread)
 
     def _manual_sync_thread(self):
         """Enhanced manual sync with retry logic"""
         try:
             if not self.app.backend_api.device_id:
-                Clock.schedule_once(
-                    lambda dt: SimpleNotification.show_error("❌ Device not registered. Scan QR code first."), 0)
+                SimpleNotification.show_error("❌ Device not registered. Scan QR code first.")
                 return
 
-            # Get latest calls
-            calls = self.app.call_manager.get_call_logs(limit=1000, force_refresh=True)
-
-            if not calls:
-                Clock.schedule_once(lambda dt: SimpleNotification.show_info("ℹ️ No calls to sync"), 0)
+            # Probe the server first and reuse the result for the status card
+            connection_result = self.app.backend_api.test_connection()
+            self.update_connection_status(connection_result)
+            if not connection_result['success']:
+                error_msg = f"❌ Sync skipped: {connection_result.get('message', 'Server unreachable')}"
+                SimpleNotification.show_error(error_msg)
                 return
 
-            # Sync with enhanced retry
-            result = self.app.backend_api.sync_calls(calls, force=True)
+            # Stream calls in batches so only one batch is held and uploaded at a time
+            synced_total = 0
+            duplicate_total = 0
+            batch_count = 0
 
-            if result['success']:
-                self.app.update_app_setting('last_sync_time', datetime.now().isoformat())
+            for batch in self.app.call_manager.get_call_logs_iter(batch=100, limit=1000):
+                result = self.app.backend_api.sync_calls_batch(batch, batch_count)
 
-                sync_msg = f"✅ Synced {result['synced_count']} calls"
-                if result['duplicate_count'] > 0:
-                    sync_msg += f" ({result['duplicate_count']} duplicates)"
+                if not result['success']:
+                    error_msg = f"❌ Sync failed: {result.get('message', 'Unknown error')}"
+                    SimpleNotification.show_error(error_msg)
+                    return
 
-                Clock.schedule_once(lambda dt: SimpleNotification.show_message(sync_msg), 0)
-                Clock.schedule_once(lambda dt: self.update_status_cards(calls), 0.5)
-            else:
-                error_msg = f"❌ Sync failed: {result.get('message', 'Unknown error')}"
-                Clock.schedule_once(lambda dt: SimpleNotification.show_error(error_msg), 0)
+                batch_count += 1
+                synced_total += result.get('synced_count', 0)
+                duplicate_total += result.get('duplicate_count', 0)
+
+                progress_msg = f"⏳ Synced {synced_total} calls ({batch_count} batches)..."
+                SimpleNotification.show_info(progress_msg)
+
+            if not batch_count:
+                SimpleNotification.show_info("ℹ️ No calls to sync")
+                return
+
+            self.app.record_sync_time()
+
+            sync_msg = f"✅ Synced {synced_total} calls"
+            if duplicate_total > 0:
+                sync_msg += f" ({duplicate_total} duplicates)"
+
+            self._finish_manual_sync(sync_msg)
 
         except Exception as e:
             error_message = f"❌ Sync error: {str(e)}"
-            Clock.schedule_once(lambda dt: SimpleNotification.show_error(error_message), 0)
+            SimpleNotification.show_error(error_message)
+
+    @mainthread
+    def _finish_manual_sync(self, sync_msg: str):
+        """Show the sync result and refresh the status cards in one main-thread pass"""
+        SimpleNotification.show_message(sync_msg)
+        self.update_status_cards(self._last_displayed_count)
 
     def scan_qr(self, *args):
         """Enhanced QR scanning"""
@@ -1349,10 +1913,7 @@ class MainScreen(MDScreen):
         self.app.auto_sync_enabled = not self.app.auto_sync_enabled
 
         # Update button text
-        for child in self.children[0].children[0].children:  # Access button layout
-            if isinstance(child, MDFlatButton) and "Auto:" in child.text:
-                child.text = "Auto: ON" if self.app.auto_sync_enabled else "Auto: OFF"
-                break
+        self.auto_sync_button.text = "Auto: ON" if self.app.auto_sync_enabled else "Auto: OFF"
 
         # Start/stop auto sync
         if self.app.auto_sync_enabled:
@@ -1362,14 +1923,14 @@ class MainScreen(MDScreen):
             SimpleNotification.show_info("⏸️ Auto-sync disabled")
 
     def update_ui(self, dt):
-        """Enhanced periodic UI updates"""
+        """Probe the connection once (on start/resume or user action)"""
         # Update connection status
-        threading.Thread(target=self._update_connection_status_thread, daemon=True).start()
+        self.app.run_in_background_once(self._update_connection_status_thread)
 
     def _update_connection_status_thread(self):
         """Update connection status in background"""
         result = self.app.backend_api.test_connection()
-        Clock.schedule_once(lambda dt: self.update_connection_status(result), 0)
+        self.update_connection_status(result)
 
 
 class QRInputDialog:
@@ -1441,16 +2002,15 @@ class QRInputDialog:
     def test_connection(self, *args):
         """Test connection before registration"""
         SimpleNotification.show_info("Testing connection...")
-        threading.Thread(target=self._test_connection_thread, daemon=True).start()
+        self.app.run_in_background(self._test_connection_thread)
 
     def _test_connection_thread(self):
         """Test connection in background"""
         result = self.app.backend_api.test_connection()
         if result['success']:
-            Clock.schedule_once(lambda dt: SimpleNotification.show_message("✅ Connection successful!"), 0)
+            SimpleNotification.show_message("✅ Connection successful!")
         else:
-            Clock.schedule_once(lambda dt: SimpleNotification.show_error(f"❌ Connection failed: {result['message']}"),
-                                0)
+            SimpleNotification.show_error(f"❌ Connection failed: {result['message']}")
 
     def close_dialog(self, *args):
         """Close dialog"""
@@ -1485,7 +2045,7 @@ class QRInputDialog:
         SimpleNotification.show_info("🔄 Registering device...")
 
         # Register in background with callback
-        threading.Thread(target=self._register_device_thread, args=(qr_data,), daemon=True).start()
+        self.app.run_in_background(self._register_device_thread, qr_data)
 
     def _register_device_thread(self, qr_data: str):
         """Enhanced device registration in background"""
@@ -1497,19 +2057,19 @@ class QRInputDialog:
                 device_name = result.get('device_name', f'Device {device_id}')
 
                 # Store device information
-                device_info = {
-                    'device_id': device_id,
-                    'device_name': device_name,
-                    'registration_time': datetime.now().isoformat(),
-                    'sync_endpoint': result.get('sync_endpoint'),
-                    'status_endpoint': result.get('status_endpoint'),
-                    'heartbeat_endpoint': result.get('heartbeat_endpoint')
-                }
+                device_info = DeviceInfo(
+                    device_id=device_id,
+                    device_name=device_name,
+                    registration_time=datetime.now().isoformat(),
+                    sync_endpoint=result.get('sync_endpoint'),
+                    status_endpoint=result.get('status_endpoint'),
+                    heartbeat_endpoint=result.get('heartbeat_endpoint')
+                )
 
-                self.app.storage.put('device_info', **device_info)
+                self.app.save_device_info(device_info)
 
                 success_message = f"✅ Device registered: {device_name}"
-                Clock.schedule_once(lambda dt: SimpleNotification.show_message(success_message), 0)
+                SimpleNotification.show_message(success_message)
 
                 # Trigger callback
                 if self.callback:
@@ -1521,11 +2081,11 @@ class QRInputDialog:
             else:
                 error_msg = result.get('message', 'Registration failed')
                 error_message = f"❌ Registration failed: {error_msg}"
-                Clock.schedule_once(lambda dt: SimpleNotification.show_error(error_message), 0)
+                SimpleNotification.show_error(error_message)
 
         except Exception as e:
             error_message = f"❌ Registration error: {str(e)}"
-            Clock.schedule_once(lambda dt: SimpleNotification.show_error(error_message), 0)
+            SimpleNotification.show_error(error_message)
 
 
 class KortahunUnitedApp(MDApp):
@@ -1541,25 +2101,58 @@ class KortahunUnitedApp(MDApp):
         # Initialize components
         self.logger = self.setup_logging()
         self.storage = None
+        self.app_settings_file = None  # Standalone JSON file for the frequently written app settings
+        self._app_settings_cache: Optional[Dict[str, Any]] = None  # In-memory copy of 'app_settings'
+        self._app_settings_dirty = False
+        self._settings_lock = threading.Lock()
+        self._settings_write_lock = threading.Lock()  # One writer of the settings file at a time
+        # Debounced on the Clock, written on the I/O pool: the fsync must not block the UI thread
+        self._settings_flush_trigger = Clock.create_trigger(
+            lambda dt: self.run_in_background_once(self._flush_app_settings), 5)
+        self._refresh_main_trigger = Clock.create_trigger(self._refresh_main_screen)  # Posts in one frame collapse
+        self._device_info_cache: Optional[DeviceInfo] = None  # In-memory copy of 'device_info'
+        self._device_info_loaded = False
         self.call_manager = CallLogManager()
         self.backend_api = BackendAPI()
         self.qr_scanner = None
+        self._settings_screen = None  # Built on first navigation
+        self._main_screen = None  # Built in build() and never removed
+        self._trim_memory_callbacks = None  # Registered with the activity so Android can reclaim the call cache
+        self._connectivity_receiver = None  # Connectivity broadcasts drive the connection card while in foreground
+        self._last_online = None
 
         # Enhanced auto sync settings
         self.auto_sync_enabled = True
         self.sync_interval = 120  # 2 minutes - more aggressive
         self.heartbeat_interval = 45  # 45 seconds
         self.call_check_interval = 10  # Check for new calls every 10 seconds
+        self.task_coalesce_window = 2  # Run sync/heartbeat together if due within 2 seconds
 
         # Background threads with better management
-        self.auto_sync_thread = None
-        self.heartbeat_thread = None
+        self.scheduler_thread = None  # Runs both auto sync and heartbeat
         self.call_monitor_thread = None
+        self._consecutive_sync_failures = 0
+        self._sync_backoff = self.sync_interval  # Current retry delay while sync keeps failing
+        self._heartbeat_backoff = self.heartbeat_interval
+        self._io_pool = ThreadPoolExecutor(max_workers=4)  # Shared pool for one-shot network/JNI work
+        self._inflight: Dict[Any, Future] = {}  # Task -> pending future, for run_in_background_once
+        self._inflight_lock = threading.Lock()
+        self._upload_executor = ThreadPoolExecutor(max_workers=1)  # Uploads one batch while the next is read
+        self._pending_sync_future: Optional[Future] = None  # Queued "sync the latest calls" request, if any
+        self._permission_retries = 0  # Permission requests made so far; capped at max_permission_retries
+        self.max_permission_retries = 5
+        self._network_lost = False  # Set while auto sync is skipping ticks for lack of network
+        self.offline_recheck_interval = 30  # Re-check connectivity this often while offline
         self.running = True
+        self.paused = False
+        self._stop_event = threading.Event()  # Set on shutdown to wake sleeping workers
+        self._scheduler_wake = threading.Event()  # Set to wake the scheduler early (shutdown or queued work)
+        self._pending_heartbeats = queue.Queue()  # One-shot heartbeat payloads for the scheduler
 
         # Sync statistics
         self.total_synced_calls = 0
         self.last_sync_time = None
+        self.last_sync_time_iso: Optional[str] = None  # last_sync_time formatted once, for settings and heartbeats
         self.sync_failures = 0
 
     def build(self):
@@ -1571,21 +2164,32 @@ class KortahunUnitedApp(MDApp):
         self.load_app_settings()
         self.load_device_info()
 
+        # Handshake with the backend while the UI is being built
+        self.run_in_background(self.backend_api.prewarm_connection)
+
         # Set call manager app instance for callbacks
         self.call_manager.set_app_instance(self)
 
         # Initialize QR scanner
         self.qr_scanner = QRScannerManager(self)
 
+        # Let Android reclaim the call cache when the app is backgrounded
+        if ANDROID_AVAILABLE:
+            try:
+                self._trim_memory_callbacks = TrimMemoryCallbacks(self.call_manager)
+                PythonActivity.mActivity.registerComponentCallbacks(self._trim_memory_callbacks)
+            except Exception as e:
+                self.logger.warning(f"Could not register memory trim callbacks: {e}")
+                self._trim_memory_callbacks = None
+
         # Create enhanced screen manager
         screen_manager = MDScreenManager()
 
-        # Add screens
+        # Add main screen; settings screen is built lazily by go_to_settings
         main_screen = MainScreen(self)
-        settings_screen = SettingsScreen(self)
+        self._main_screen = main_screen
 
         screen_manager.add_widget(main_screen)
-        screen_manager.add_widget(settings_screen)
         screen_manager.current = 'main'
 
         # Request permissions immediately on Android
@@ -1606,26 +2210,53 @@ class KortahunUnitedApp(MDApp):
         )
         logger = logging.getLogger('KortahunUnited')
 
+        # Loggers only enqueue records; a listener thread does the actual I/O
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        handlers = [stream_handler]
+
         if ANDROID_AVAILABLE:
             try:
                 log_path = os.path.join(primary_external_storage_path(), 'KortahunUnited', 'logs')
                 os.makedirs(log_path, exist_ok=True)
 
-                file_handler = logging.FileHandler(os.path.join(log_path, 'app.log'))
-                file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-                logger.addHandler(file_handler)
+                # Size-capped files, opened on first write (delay=True) by the listener thread
+                app_file = RotatingFileHandler(os.path.join(log_path, 'app.log'),
+                                               maxBytes=1_000_000, backupCount=3, delay=True)
+                app_file.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+                # Buffer records and write them in batches; warnings and errors flush immediately
+                file_handler = MemoryHandler(64, flushLevel=logging.WARNING, target=app_file)
+                file_handler.addFilter(lambda record: record.name != 'sync_stats')
+                handlers.append(file_handler)
 
                 # Also log sync statistics
-                sync_handler = logging.FileHandler(os.path.join(log_path, 'sync.log'))
-                sync_handler.setFormatter(logging.Formatter('%(asctime)s - SYNC - %(message)s'))
+                sync_file = RotatingFileHandler(os.path.join(log_path, 'sync.log'),
+                                                maxBytes=1_000_000, backupCount=3, delay=True)
+                sync_file.setFormatter(logging.Formatter('%(asctime)s - SYNC - %(message)s'))
+                sync_handler = MemoryHandler(64, flushLevel=logging.WARNING, target=sync_file)
+                sync_handler.addFilter(lambda record: record.name == 'sync_stats')
+                handlers.append(sync_handler)
 
                 sync_logger = logging.getLogger('sync_stats')
-                sync_logger.addHandler(sync_handler)
+                sync_logger.addHandler(QueueHandler(log_queue))
 
                 print(f"📝 Enhanced logging to: {log_path}")
             except Exception as e:
                 print(f"⚠️ Could not setup file logging: {e}")
 
+        logger.addHandler(QueueHandler(log_queue))
+        logger.propagate = False
+
+        # CallLogManager and BackendAPI log under the module name; route them through the queue too
+        module_logger = logging.getLogger(__name__)
+        module_logger.addHandler(QueueHandler(log_queue))
+        module_logger.propagate = False
+
+        self._log_listener = QueueListener(log_queue, *handlers)
+        self._log_listener.start()
+
         return logger
 
     def setup_storage(self):
@@ -1639,18 +2270,20 @@ class KortahunUnitedApp(MDApp):
                 storage_file = 'kortahun_settings_v2.json'
 
             self.storage = JsonStore(storage_file)
+            self.app_settings_file = os.path.join(os.path.dirname(storage_file), 'app_settings.json')
             self.logger.info(f"📁 Enhanced storage initialized: {storage_file}")
 
         except Exception as e:
             self.logger.error(f"Storage setup failed: {e}")
             self.storage = JsonStore('fallback_settings_v2.json')
+            self.app_settings_file = 'fallback_app_settings_v2.json'
 
     def load_app_settings(self):
         """Load enhanced app settings"""
         try:
-            if self.storage.exists('app_settings'):
-                app_settings = self.storage.get('app_settings')
-
+            app_settings = self._read_app_settings()
+            self._app_settings_cache = dict(app_settings)
+            if app_settings:
                 saved_url = app_settings.get('server_url')
                 if saved_url:
                     self.backend_api.base_url = saved_url
@@ -1661,54 +2294,64 @@ class KortahunUnitedApp(MDApp):
                 self.sync_interval = app_settings.get('sync_interval', 120)
                 self.heartbeat_interval = app_settings.get('heartbeat_interval', 45)
 
-                self.logger.info(
-                    f"Loaded settings: auto_sync={self.auto_sync_enabled}, sync_interval={self.sync_interval}s")
+                self.logger.info("Loaded settings: auto_sync=%s, sync_interval=%ss",
+                                 self.auto_sync_enabled, self.sync_interval)
         except Exception as e:
-            self.logger.error(f"Error loading app settings: {e}")
+            self.logger.error("Error loading app settings: %s", e)
 
     def load_device_info(self):
         """Load device info with validation"""
         try:
-            if self.storage.exists('device_info'):
-                device_info = self.storage.get('device_info')
-
-                device_id = device_info.get('device_id')
-                device_name = device_info.get('device_name')
+            device_info = self.get_device_info()
+            if device_info:
+                device_id = device_info.device_id
+                device_name = device_info.device_name
 
                 if device_id and len(device_id) > 10:  # Basic validation
-                    self.backend_api.device_id = device_id
-                    self.backend_api.session.headers.update({'X-Device-ID': device_id})
-                    self.logger.info(f"Loaded device: {device_name} ({device_id[:8]}...)")
+                    self.backend_api.set_device_id(device_id)
+                    self.logger.info("Loaded device: %s (%s...)", device_name, device_id[:8])
                 else:
                     self.logger.warning("Invalid device ID found, clearing...")
-                    self.storage.delete('device_info')
+                    self.clear_device_info()
 
         except Exception as e:
-            self.logger.error(f"Error loading device info: {e}")
+            self.logger.error("Error loading device info: %s", e)
 
     def request_permissions_aggressively(self, dt):
         """Request permissions with multiple attempts"""
         if ANDROID_AVAILABLE:
-            self.logger.info("📱 Requesting Android permissions aggressively...")
+            if self._permission_retries >= self.max_permission_retries:
+                self.logger.warning("⚠️ Giving up on permissions after %d attempts", self._permission_retries)
+                return
+
+            self._permission_retries += 1
+            self.logger.info("📱 Requesting Android permissions (attempt %d)...", self._permission_retries)
 
             def request_in_thread():
                 success = self.call_manager.request_permissions()
                 if success:
                     self.logger.info("✅ Permissions granted successfully")
+                    self._permission_retries = 0
                     # Immediately try to load call logs
                     Clock.schedule_once(lambda dt: self.trigger_immediate_data_load(), 1)
                 else:
                     self.logger.warning("⚠️ Permission request failed")
-                    # Retry after delay
-                    Clock.schedule_once(lambda dt: self.request_permissions_aggressively(dt), 5)
+                    # Retry with capped exponential backoff
+                    delay = min(5 * 2 ** self._permission_retries, 60)
+                    Clock.schedule_once(self.request_permissions_aggressively, delay)
 
+            # Its own thread, since the dialog wait can block for up to 60s and must not hold an
+            # I/O pool worker. Only one runs at a time (the next attempt is scheduled once this
+            # one finishes) and the retry cap bounds the total
             threading.Thread(target=request_in_thread, daemon=True).start()
 
     def trigger_immediate_data_load(self):
         """Trigger immediate data loading after permissions"""
 
         def load_data():
-            calls = self.call_manager.get_call_logs(limit=50, force_refresh=True)
+            # Not forced: the main screen's initial load may already hold a fresh read
+            # (or still be running it); forcing would cancel that read and scan again
+            calls = self.call_manager.get_call_logs(limit=50)
             self.logger.info(f"📞 Loaded {len(calls)} calls after permission grant")
 
             # Update main screen if available
@@ -1716,7 +2359,7 @@ class KortahunUnitedApp(MDApp):
             if main_screen:
                 Clock.schedule_once(lambda dt: main_screen.update_calls_display(calls), 0)
 
-        threading.Thread(target=load_data, daemon=True).start()
+        self.run_in_background(load_data)
 
     def start_all_background_services(self, dt):
         """Start all enhanced background services"""
@@ -1735,21 +2378,20 @@ class KortahunUnitedApp(MDApp):
         if not self.auto_sync_enabled:
             return
 
-        if self.auto_sync_thread and self.auto_sync_thread.is_alive():
-            return  # Already running
-
-        self.auto_sync_thread = threading.Thread(target=self.enhanced_auto_sync_worker, daemon=True)
-        self.auto_sync_thread.start()
-        self.logger.info("🔄 Enhanced auto sync started")
+        self._ensure_scheduler_running()
 
     def start_heartbeat_service(self):
         """Start enhanced heartbeat service"""
-        if self.heartbeat_thread and self.heartbeat_thread.is_alive():
+        self._ensure_scheduler_running()
+
+    def _ensure_scheduler_running(self):
+        """Start the shared sync/heartbeat scheduler thread if needed"""
+        if self.scheduler_thread and self.scheduler_thread.is_alive():
             return  # Already running
 
-        self.heartbeat_thread = threading.Thread(target=self.enhanced_heartbeat_worker, daemon=True)
-        self.heartbeat_thread.start()
-        self.logger.info("💓 Enhanced heartbeat service started")
+        self.scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
+        self.scheduler_thread.start()
+        self.logger.info("🔄 Sync/heartbeat scheduler started")
 
     def start_call_monitor(self):
         """Start call monitoring service"""
@@ -1760,153 +2402,298 @@ class KortahunUnitedApp(MDApp):
         self.call_monitor_thread.start()
         self.logger.info("📞 Call monitor service started")
 
-    def enhanced_auto_sync_worker(self):
-        """Enhanced auto sync worker with better error handling"""
-        consecutive_failures = 0
+    def run_scheduler(self):
+        """Run auto sync and heartbeat from one thread using a deadline heap"""
+        now = time.monotonic()
+        schedule = [(now, 'sync'), (now, 'heartbeat')]
+
+        while not self._stop_event.is_set():
+            delay = schedule[0][0] - time.monotonic()
+            if delay > 0:
+                self._scheduler_wake.wait(delay)
+                self._scheduler_wake.clear()
+                if self._stop_event.is_set():
+                    break
+
+            # Send one-shot heartbeats queued from other threads before the regular tasks
+            while True:
+                try:
+                    payload = self._pending_heartbeats.get_nowait()
+                except queue.Empty:
+                    break
+                self._send_one_shot_heartbeat(payload)
+
+            # Run every task due within the coalescing window in this wakeup
+            now = time.monotonic()
+            due = []
+            while schedule and schedule[0][0] <= now + self.task_coalesce_window:
+                due.append(heapq.heappop(schedule)[1])
+
+            # Sync first; if it just failed after exhausting its retries, a heartbeat in the same
+            # wakeup would only burn another round of timeouts on the same dead link
+            due.sort(key=lambda task: task != 'sync')
+            sync_failed = False
+            for task in due:
+                if task == 'sync':
+                    failures_before = self._consecutive_sync_failures
+                    next_delay = self.auto_sync_tick()
+                    sync_failed = self._consecutive_sync_failures > failures_before
+                elif sync_failed:
+                    self.logger.info("Deferring heartbeat after failed sync in the same wakeup")
+                    next_delay = self._next_heartbeat_backoff()
+                else:
+                    next_delay = self.heartbeat_tick()
+                heapq.heappush(schedule, (time.monotonic() + next_delay, task))
 
-        while self.running and self.auto_sync_enabled:
-            try:
-                if self.backend_api.device_id:
-                    self.logger.info("🔄 Performing enhanced auto sync...")
+    def auto_sync_tick(self) -> float:
+        """Perform one auto sync pass and return the delay until the next one"""
+        if not self.auto_sync_enabled:
+            return self.sync_interval
 
-                    # Get latest calls
-                    calls = self.call_manager.get_call_logs(limit=1000, force_refresh=True)
+        try:
+            if not self.is_foreground_main():
+                self.logger.info("Auto sync paused while app is in background or off main screen")
+            elif self.backend_api.device_id:
+                # Skip the whole read/encode/upload pipeline while offline
+                if not self.backend_api.is_network_available():
+                    if not self._network_lost:
+                        self.logger.info("No network - skipping auto sync until connectivity returns")
+                    self._network_lost = True
+                    return min(self.offline_recheck_interval, self.sync_interval)
+
+                if self._network_lost:
+                    # Failures while offline say nothing about the server; start fresh
+                    self.logger.info("Network restored - resuming auto sync")
+                    self._network_lost = False
+                    self._consecutive_sync_failures = 0
+                    self._sync_backoff = self.sync_interval
+
+                self.logger.info("Performing enhanced auto sync...")
+
+                # Only query calls newer than the last synced one; start from "now" on first run
+                watermark = self.get_app_setting('last_sync_watermark')
+                if watermark is None:
+                    watermark = int(time.time() * 1000)
+                    self.update_app_setting('last_sync_watermark', watermark)
+
+                result, batch_count, uploaded_ms = self._stream_sync_since(watermark)
+
+                # Batches go oldest first, so every call up to the newest one the server accepted
+                # is uploaded, even when a later batch failed; the rest is retried from there
+                if uploaded_ms is not None and uploaded_ms > watermark:
+                    self.update_app_setting('last_sync_watermark', uploaded_ms)
+
+                if batch_count:
+                    if result['success']:
+                        synced_count = result['synced_count']
+                        self.total_synced_calls += synced_count
+                        self._consecutive_sync_failures = 0
+                        self._sync_backoff = self.sync_interval
 
-                    if calls:
-                        result = self.backend_api.sync_calls(calls)
+                        # Update app settings
+                        self.record_sync_time()
+                        self.update_app_setting('total_synced_calls', self.total_synced_calls)
 
-                        if result['success']:
-                            synced_count = result.get('synced_count', 0)
-                            self.total_synced_calls += synced_count
-                            self.last_sync_time = datetime.now()
-                            consecutive_failures = 0
+                        self.logger.info("Auto sync completed: %d new calls, %d total",
+                                         synced_count, self.total_synced_calls)
 
-                            # Update app settings
-                            self.update_app_setting('last_sync_time', self.last_sync_time.isoformat())
-                            self.update_app_setting('total_synced_calls', self.total_synced_calls)
+                        # Show notification for significant syncs
+                        if synced_count > 0:
+                            SimpleNotification.show_message(f"📞 Auto-synced {synced_count} calls")
 
-                            self.logger.info(
-                                f"✅ Auto sync completed: {synced_count} new calls, {self.total_synced_calls} total")
+                    else:
+                        self._consecutive_sync_failures += 1
+                        self.sync_failures += 1
+                        self.logger.error("❌ Auto sync failed (failure #%d): %s",
+                                          self._consecutive_sync_failures, result.get('message'))
+                        return self._next_sync_backoff()
 
-                            # Show notification for significant syncs
-                            if synced_count > 0:
-                                Clock.schedule_once(
-                                    lambda dt: SimpleNotification.show_message(f"📞 Auto-synced {synced_count} calls"),
-                                    0
-                                )
+                else:
+                    self.logger.info("No new calls since last auto sync")
 
-                        else:
-                            consecutive_failures += 1
-                            self.sync_failures += 1
-                            self.logger.error(
-                                f"❌ Auto sync failed (failure #{consecutive_failures}): {result.get('message')}")
-
-                            # Exponential backoff for failures
-                            if consecutive_failures > 3:
-                                wait_time = min(self.sync_interval * 2, 600)  # Max 10 minutes
-                                self.logger.info(
-                                    f"⏳ Backing off for {wait_time}s after {consecutive_failures} failures")
-                                time.sleep(wait_time)
-                                continue
+        except Exception as e:
+            self._consecutive_sync_failures += 1
+            self.sync_failures += 1
+            self.logger.error("❌ Auto sync error (failure #%d): %s", self._consecutive_sync_failures, e)
+            return self._next_sync_backoff()
+
+        # Nothing was attempted this pass; keep the current delay if still failing
+        if self._consecutive_sync_failures > 0:
+            return self._sync_backoff
+        return self.sync_interval
+
+    def _stream_sync_since(self, watermark: int) -> Tuple[Dict[str, Any], int, Optional[int]]:
+        """Upload calls newer than watermark oldest first, reading the next batch during each upload
+
+        Returns (result, batch_count, uploaded ms): the raw DATE of the newest call in the last
+        batch the server accepted, or None if none was. Batches are uploaded in order with one
+        in flight and stop at the first failure, so every call up to uploaded ms is on the server.
+        """
+        batches = self.call_manager.iter_calls_since(watermark, batch=self.backend_api.SYNC_CHUNK_SIZE)
+        result = {'success': True, 'synced_count': 0}
+        synced_count = 0
+        batch_count = 0
+        uploaded_ms = None
+        pending = None
+        pending_ms = None
 
-                    else:
-                        self.logger.info("ℹ️ No calls available for auto sync")
+        try:
+            for batch, batch_ms in batches:
+                if pending:
+                    result = pending.result()
+                    if not result['success']:
+                        return result, batch_count, uploaded_ms
+                    synced_count += result.get('synced_count', 0)
+                    uploaded_ms = pending_ms
+
+                pending = self._upload_executor.submit(
+                    self.backend_api.sync_calls, batch,
+                    batch_info={'batchIndex': batch_count, 'batchSize': len(batch)})
+                pending_ms = batch_ms
+                batch_count += 1
+
+            if pending:
+                result = pending.result()
+                if not result['success']:
+                    return result, batch_count, uploaded_ms
+                synced_count += result.get('synced_count', 0)
+                uploaded_ms = pending_ms
+        finally:
+            batches.close()
 
-            except Exception as e:
-                consecutive_failures += 1
-                self.sync_failures += 1
-                self.logger.error(f"❌ Auto sync error (failure #{consecutive_failures}): {e}")
+        return {**result, 'synced_count': synced_count}, batch_count, uploaded_ms
 
-            # Dynamic sleep interval based on failures
-            sleep_time = self.sync_interval
-            if consecutive_failures > 0:
-                sleep_time = min(self.sync_interval * (1 + consecutive_failures * 0.5), 600)
+    def _next_sync_backoff(self) -> float:
+        """Double the sync retry delay (with jitter) after a failure"""
+        self._sync_backoff = min(max(self._sync_backoff, self.sync_interval) * 2, 3600) + random.uniform(0, 30)
+        self.logger.info("Backing off auto sync for %.0fs after %d failures",
+                         self._sync_backoff, self._consecutive_sync_failures)
+        return self._sync_backoff
 
-            time.sleep(sleep_time)
+    def heartbeat_tick(self) -> float:
+        """Send one heartbeat and return the delay until the next one"""
+        try:
+            if self.backend_api.device_id and self.backend_api.is_network_available():
+                # Enhanced heartbeat data
+                status_data = {
+                    'totalSyncedCalls': self.total_synced_calls,
+                    'syncFailures': self.sync_failures,
+                    'lastSyncTime': self.last_sync_time_iso,
+                    'autoSyncEnabled': self.auto_sync_enabled,
+                    'syncInterval': self.sync_interval,
+                    'permissionsGranted': self.call_manager.permissions_granted,
+                    'callCacheSize': self.call_manager.cached_call_count()
+                }
 
-    def enhanced_heartbeat_worker(self):
-        """Enhanced heartbeat worker"""
-        while self.running:
-            try:
-                if self.backend_api.device_id:
-                    # Enhanced heartbeat data
-                    status_data = {
-                        'totalSyncedCalls': self.total_synced_calls,
-                        'syncFailures': self.sync_failures,
-                        'lastSyncTime': self.last_sync_time.isoformat() if self.last_sync_time else None,
-                        'autoSyncEnabled': self.auto_sync_enabled,
-                        'syncInterval': self.sync_interval,
-                        'permissionsGranted': self.call_manager.permissions_granted,
-                        'callCacheSize': len(self.call_manager._call_cache) if hasattr(self.call_manager,
-                                                                                       '_call_cache') else 0
-                    }
+                result = self.backend_api.send_heartbeat(status_data)
+                if result['success']:
+                    self._heartbeat_backoff = self.heartbeat_interval
+                    self.logger.info("Heartbeat sent successfully")
 
-                    result = self.backend_api.send_heartbeat(status_data)
-                    if result['success']:
-                        self.logger.info("💓 Enhanced heartbeat sent successfully")
+                    # Process server instructions if any
+                    instructions = result.get('server_instructions', {})
+                    if instructions:
+                        self.process_server_instructions(instructions)
+                else:
+                    self.logger.warning("💔 Heartbeat failed: %s", result.get('message'))
+                    return self._next_heartbeat_backoff()
 
-                        # Process server instructions if any
-                        instructions = result.get('server_instructions', {})
-                        if instructions:
-                            self.process_server_instructions(instructions)
-                    else:
-                        self.logger.warning(f"💔 Heartbeat failed: {result.get('message')}")
+        except Exception as e:
+            self.logger.error("💔 Heartbeat error: %s", e)
+            return self._next_heartbeat_backoff()
 
-            except Exception as e:
-                self.logger.error(f"💔 Heartbeat error: {e}")
+        return self.heartbeat_interval
 
-            time.sleep(self.heartbeat_interval)
+    def _next_heartbeat_backoff(self) -> float:
+        """Double the heartbeat retry delay (with jitter) after a failure"""
+        self._heartbeat_backoff = (min(max(self._heartbeat_backoff, self.heartbeat_interval) * 2, 600)
+                                   + random.uniform(0, 10))
+        return self._heartbeat_backoff
 
     def call_monitor_worker(self):
         """Monitor for new calls and trigger immediate sync"""
-        last_call_count = 0
+        last_seen_ms = None  # Newest call date seen so far; each poll only asks for rows after it
+        quiet_polls = 0  # Consecutive polls without a new call; backs the poll interval off
 
-        while self.running:
+        while not self._stop_event.is_set():
             try:
                 if ANDROID_AVAILABLE and self.call_manager.permissions_granted:
-                    # Check current call count
-                    current_calls = self.call_manager.get_call_logs(limit=10, force_refresh=False)
-                    current_count = len(current_calls)
-
-                    if current_count != last_call_count and last_call_count > 0:
-                        self.logger.info(f"📞 New call detected! Count: {last_call_count} -> {current_count}")
-
-                        # Trigger immediate sync if auto-sync is enabled
-                        if self.auto_sync_enabled and self.backend_api.device_id:
-                            threading.Thread(target=self.immediate_sync_new_calls, daemon=True).start()
+                    if last_seen_ms is None:
+                        # Baseline from the single newest row; None (read failed) retries next poll
+                        last_seen_ms = self.call_manager.newest_call_ms()
+                    else:
+                        # Oldest first from the raw DATE column, so the watermark lands on the newest row read
+                        new_calls = []
+                        for batch, batch_ms in self.call_manager.iter_calls_since(last_seen_ms):
+                            new_calls.extend(batch)
+                            last_seen_ms = batch_ms
+
+                        if not new_calls:
+                            quiet_polls += 1
+                        else:
+                            quiet_polls = 0
+                            self.logger.info("New call detected! %d new since last check", len(new_calls))
+                            self.call_manager.invalidate_cache()
 
-                        # Update UI
-                        main_screen = self.get_main_screen()
-                        if main_screen:
-                            Clock.schedule_once(lambda dt: main_screen.force_refresh(), 0)
+                            # Trigger immediate sync if auto-sync is enabled
+                            if self.auto_sync_enabled and self.backend_api.device_id:
+                                self.submit_immediate_sync(new_calls)
 
-                    last_call_count = current_count
+                            # Update UI
+                            self._refresh_main_trigger()
 
             except Exception as e:
-                self.logger.error(f"📞 Call monitor error: {e}")
+                self.logger.error("📞 Call monitor error: %s", e)
+
+            # Double the interval per quiet poll, capped at the auto sync interval (which picks up
+            # anything missed), with jitter so devices don't poll in lockstep
+            interval = min(self.call_check_interval * (2 ** min(quiet_polls, 5)),
+                           max(self.sync_interval, self.call_check_interval))
+            interval *= random.uniform(0.85, 1.15)
 
-            time.sleep(self.call_check_interval)
+            # Interruptible sleep: on_stop sets the event so the join below doesn't time out
+            if self._stop_event.wait(interval):
+                break
 
-    def immediate_sync_new_calls(self):
-        """Immediate sync for new calls"""
+    def record_sync_time(self):
+        """Stamp a successful sync; the ISO string is formatted once and reused by heartbeats"""
+        self.last_sync_time = datetime.now()
+        self.last_sync_time_iso = self.last_sync_time.isoformat()
+        self.update_app_setting('last_sync_time', self.last_sync_time_iso)
+
+    def submit_immediate_sync(self, calls: Optional[List[Dict[str, Any]]] = None) -> Future:
+        """Queue an immediate sync on the upload executor so it never overlaps another upload
+
+        Requests to sync the latest calls (no explicit list) collapse into one while queued.
+        """
+        with self._inflight_lock:
+            pending = self._pending_sync_future
+            if calls is None and pending is not None and not pending.done():
+                return pending
+            future = self._upload_executor.submit(self.immediate_sync_new_calls, calls)
+            future.add_done_callback(self._log_background_error)
+            if calls is None:
+                self._pending_sync_future = future
+            return future
+
+    def immediate_sync_new_calls(self, calls: Optional[List[Dict[str, Any]]] = None):
+        """Immediate sync for new calls (the latest 100 if none are given)"""
         try:
             self.logger.info("🚀 Triggering immediate sync for new calls")
-            calls = self.call_manager.get_call_logs(limit=100, force_refresh=True)
+            if calls is None:
+                calls = self.call_manager.get_call_logs(limit=100, force_refresh=True)
 
             if calls:
                 result = self.backend_api.sync_calls(calls, force=True)
                 if result['success']:
                     synced_count = result.get('synced_count', 0)
-                    self.logger.info(f"⚡ Immediate sync completed: {synced_count} calls")
+                    self.logger.info("⚡ Immediate sync completed: %s calls", synced_count)
 
                     if synced_count > 0:
-                        Clock.schedule_once(
-                            lambda dt: SimpleNotification.show_message(f"⚡ New calls synced: {synced_count}"),
-                            0
-                        )
+                        SimpleNotification.show_message(f"⚡ New calls synced: {synced_count}")
 
         except Exception as e:
-            self.logger.error(f"Error in immediate sync: {e}")
+            self.logger.error("Error in immediate sync: %s", e)
 
     def process_server_instructions(self, instructions):
         """Process instructions from server"""
@@ -1917,15 +2704,15 @@ class KortahunUnitedApp(MDApp):
                 if 60 <= new_interval <= 3600:  # Between 1 minute and 1 hour
                     self.sync_interval = new_interval
                     self.update_app_setting('sync_interval', new_interval)
-                    self.logger.info(f"📝 Sync interval updated to {new_interval}s by server")
+                    self.logger.info("📝 Sync interval updated to %ss by server", new_interval)
 
             # Handle forced sync requests
             if instructions.get('forcedSync'):
                 self.logger.info("🔄 Server requested forced sync")
-                threading.Thread(target=self.immediate_sync_new_calls, daemon=True).start()
+                self.submit_immediate_sync()
 
         except Exception as e:
-            self.logger.error(f"Error processing server instructions: {e}")
+            self.logger.error("Error processing server instructions: %s", e)
 
     def start_qr_scan(self):
         """Enhanced QR scanning with multiple methods"""
@@ -1975,18 +2762,24 @@ class KortahunUnitedApp(MDApp):
         self.start_call_monitor()
 
         # Send initial heartbeat
-        threading.Thread(target=self.send_initial_heartbeat, daemon=True).start()
+        self.send_initial_heartbeat()
 
     def send_initial_heartbeat(self):
-        """Send initial heartbeat after registration"""
+        """Queue the initial heartbeat after registration on the scheduler thread"""
+        self._pending_heartbeats.put({
+            'status': 'just_registered',
+            'registrationMethod': 'qr_code_scan',
+            'appVersion': '2.0.0',
+            'servicesStarted': True
+        })
+        self._ensure_scheduler_running()
+        self._scheduler_wake.set()
+
+    def _send_one_shot_heartbeat(self, payload: Dict[str, Any]):
+        """Send a queued heartbeat outside the regular heartbeat cadence"""
         try:
             if self.backend_api.device_id:
-                result = self.backend_api.send_heartbeat({
-                    'status': 'just_registered',
-                    'registrationMethod': 'qr_code_scan',
-                    'appVersion': '2.0.0',
-                    'servicesStarted': True
-                })
+                result = self.backend_api.send_heartbeat(payload)
 
                 if result['success']:
                     self.logger.info("💓 Initial heartbeat sent successfully")
@@ -2010,59 +2803,251 @@ class KortahunUnitedApp(MDApp):
                         synced_count = result.get('synced_count', 0)
                         self.logger.info(f"✅ Initial sync completed: {synced_count} calls")
 
-                        Clock.schedule_once(
-                            lambda dt: SimpleNotification.show_message(f"🎉 Initial sync: {synced_count} calls"),
-                            0
-                        )
+                        SimpleNotification.show_message(f"🎉 Initial sync: {synced_count} calls")
 
                         # Update statistics
                         self.total_synced_calls = synced_count
-                        self.last_sync_time = datetime.now()
-                        self.update_app_setting('last_sync_time', self.last_sync_time.isoformat())
+                        self.record_sync_time()
 
             except Exception as e:
                 self.logger.error(f"Error in initial sync: {e}")
 
-        threading.Thread(target=initial_sync, daemon=True).start()
+        self.run_in_background(initial_sync)
+
+    def run_in_background(self, fn, *args) -> Future:
+        """Run blocking network/JNI work on the shared I/O pool instead of a new thread"""
+        future = self._io_pool.submit(fn, *args)
+        future.add_done_callback(self._log_background_error)
+        return future
+
+    def run_in_background_once(self, fn, *args) -> Future:
+        """Like run_in_background, but while fn is still queued or running, reuse that run"""
+        with self._inflight_lock:
+            future = self._inflight.get(fn)
+            if future is not None and not future.done():
+                return future
+            future = self.run_in_background(fn, *args)
+            self._inflight[fn] = future
+            return future
+
+    def _log_background_error(self, future: Future):
+        """Surface exceptions that would otherwise be swallowed by the pool"""
+        if not future.cancelled() and future.exception():
+            self.logger.error("Background task failed: %s", future.exception())
+
+    def _refresh_main_screen(self, *args):
+        """Refresh the main screen's call list, if it has been built"""
+        main_screen = self.get_main_screen()
+        if main_screen:
+            main_screen.force_refresh()
 
     def get_main_screen(self):
-        """Get main screen reference"""
+        """Get main screen reference (None until build() has run)"""
+        return self._main_screen
+
+    def get_stored(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a stored entry with a single lookup, None if missing"""
         try:
-            return self.root.get_screen('main')
-        except:
+            return self.storage.get(key)
+        except KeyError:
             return None
 
+    def delete_stored(self, key: str):
+        """Delete a stored entry with a single lookup, ignoring missing keys"""
+        try:
+            self.storage.delete(key)
+        except KeyError:
+            pass
+
+    def get_device_info(self) -> Optional[DeviceInfo]:
+        """Read device info, hitting storage only on first access"""
+        if not self._device_info_loaded:
+            stored = self.get_stored('device_info')
+            self._device_info_cache = DeviceInfo.from_dict(stored) if stored else None
+            self._device_info_loaded = True
+        return self._device_info_cache
+
+    def save_device_info(self, device_info: DeviceInfo):
+        """Persist device info and refresh the in-memory copy"""
+        self.storage.put('device_info', **asdict(device_info))
+        self._device_info_cache = device_info
+        self._device_info_loaded = True
+
+    def clear_device_info(self):
+        """Remove stored device info and the in-memory copy"""
+        self.delete_stored('device_info')
+        self._device_info_cache = None
+        self._device_info_loaded = True
+
+    def get_app_setting(self, key: str, default=None):
+        """Read a single app setting from the in-memory cache"""
+        with self._settings_lock:
+            if self._app_settings_cache is None:
+                self._app_settings_cache = self._read_app_settings()
+            return self._app_settings_cache.get(key, default)
+
     def update_app_setting(self, key: str, value):
-        """Enhanced app setting update"""
+        """Update an app setting in memory; the write to storage is coalesced"""
         try:
-            if self.storage.exists('app_settings'):
-                app_settings = self.storage.get('app_settings')
-            else:
-                app_settings = {}
+            with self._settings_lock:
+                if self._app_settings_cache is None:
+                    self._app_settings_cache = self._read_app_settings()
+                self._app_settings_cache[key] = value
+                self._app_settings_dirty = True
 
-            app_settings[key] = value
-            self.storage.put('app_settings', **app_settings)
+            self._settings_flush_trigger()
 
         except Exception as e:
-            self.logger.error(f"Error updating app setting {key}: {e}")
+            self.logger.error("Error updating app setting %s: %s", key, e)
 
-    def open_settings(self):
-        """Open settings screen"""
+    def _read_app_settings(self) -> Dict[str, Any]:
+        """Read app settings from their own file, migrating the old JsonStore entry"""
+        try:
+            with open(self.app_settings_file, 'rb') as f:
+                return loads_json(f.read())
+        except FileNotFoundError:
+            return dict(self.get_stored('app_settings') or {})
+        except ValueError as e:
+            self.logger.error(f"Corrupt app settings file, starting fresh: {e}")
+            return {}
+
+    def _flush_app_settings(self, *args):
+        """Write pending app settings atomically (temp file + fsync + rename)"""
+        with self._settings_write_lock:
+            with self._settings_lock:
+                if not self._app_settings_dirty:
+                    return
+                app_settings = dict(self._app_settings_cache)
+                self._app_settings_dirty = False  # Changes made during the write set it again
+
+            tmp_file = f"{self.app_settings_file}.tmp"
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(dumps_json(app_settings))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.app_settings_file)
+
+                # Drop the pre-migration copy once the new file is in place
+                self.delete_stored('app_settings')
+            except Exception as e:
+                self.logger.error(f"Error saving app settings: {e}")
+
+                # Keep the change pending and try again on the next coalesced write
+                with self._settings_lock:
+                    self._app_settings_dirty = True
+                self._settings_flush_trigger()
+
+    def reset_app_settings(self):
+        """Drop app settings, their file, and any pending write"""
+        self._settings_flush_trigger.cancel()
+        with self._settings_lock:
+            self._app_settings_cache = {}
+            self._app_settings_dirty = False
+
+        try:
+            if self.app_settings_file and os.path.exists(self.app_settings_file):
+                os.remove(self.app_settings_file)
+        except OSError as e:
+            self.logger.error(f"Error removing app settings file: {e}")
+
+    def go_to_settings(self):
+        """Open settings screen, building it on first use"""
+        if not self._settings_screen:
+            self._settings_screen = SettingsScreen(self)
+            self.root.add_widget(self._settings_screen)
         self.root.current = 'settings'
 
     def go_back(self):
         """Go back to main screen"""
         self.root.current = 'main'
 
+    def is_foreground_main(self) -> bool:
+        """Check whether the app is visible and showing the main screen"""
+        try:
+            return not self.paused and self.root.current == 'main'
+        except Exception:
+            return False
+
+    def probe_connection(self):
+        """Run a single connection probe and show the result on the main screen"""
+        main_screen = self.get_main_screen()
+        if main_screen:
+            main_screen.update_ui(0)
+
+    def _on_connectivity_change(self, context, intent):
+        """Connectivity broadcast: reflect offline locally, re-probe the backend when back online"""
+        online = self.backend_api.is_network_available()
+        if online == self._last_online:
+            return
+        self._last_online = online
+
+        if online:
+            self.probe_connection()
+        else:
+            main_screen = self.get_main_screen()
+            if main_screen:
+                main_screen.update_connection_status({'success': False})
+
+    def start_connectivity_receiver(self):
+        """Listen for connectivity changes instead of polling the backend for them"""
+        # android.broadcast is imported alongside the scanner support
+        if not SCANNER_AVAILABLE or self._connectivity_receiver is not None:
+            return
+        try:
+            # The sticky broadcast delivered on registration is a no-op unless the state differs
+            self._last_online = self.backend_api.is_network_available()
+
+            # A fresh receiver per start: p4a's BroadcastReceiver starts its HandlerThread in start(),
+            # and a Java thread cannot be started twice
+            self._connectivity_receiver = BroadcastReceiver(
+                self._on_connectivity_change, actions=['android.net.conn.CONNECTIVITY_CHANGE'])
+            self._connectivity_receiver.start()
+        except Exception as e:
+            self.logger.warning(f"Could not register connectivity receiver: {e}")
+            self._connectivity_receiver = None
+
+    def stop_connectivity_receiver(self):
+        """Stop listening for connectivity changes (a no-op if already stopped)"""
+        receiver, self._connectivity_receiver = self._connectivity_receiver, None
+        if receiver:
+            try:
+                receiver.stop()
+            except Exception:
+                pass
+
+    def on_start(self):
+        """Probe the connection once the UI is up"""
+        self.probe_connection()
+        self.start_connectivity_receiver()
+
+    def on_pause(self):
+        """Pause auto sync while in background; keep the app alive"""
+        self.logger.info("⏸️ App paused - suspending auto sync")
+        self.paused = True
+        self.stop_connectivity_receiver()
+        return True
+
+    def on_resume(self):
+        """Resume auto sync and re-probe the connection"""
+        self.logger.info("▶️ App resumed")
+        self.paused = False
+        self.probe_connection()
+        self.start_connectivity_receiver()
+
     def on_stop(self):
         """Enhanced app stop with proper cleanup"""
         self.logger.info("🛑 Enhanced app stopping...")
         self.running = False
+        self._stop_event.set()
+        self._scheduler_wake.set()
+        self._upload_executor.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.stop_connectivity_receiver()
 
         # Stop all threads gracefully
         threads_to_wait = [
-            (self.auto_sync_thread, "auto_sync"),
-            (self.heartbeat_thread, "heartbeat"),
+            (self.scheduler_thread, "scheduler"),
             (self.call_monitor_thread, "call_monitor")
         ]
 
@@ -2071,8 +3056,26 @@ class KortahunUnitedApp(MDApp):
                 self.logger.info(f"⏳ Waiting for {name} thread to finish...")
                 thread.join(timeout=5)
 
+        # Persist any settings still waiting on the coalesced write, here rather than on the pool
+        self._settings_flush_trigger.cancel()
+        self._flush_app_settings()
+
+        if self._trim_memory_callbacks:
+            try:
+                PythonActivity.mActivity.unregisterComponentCallbacks(self._trim_memory_callbacks)
+            except Exception:
+                pass
+
         self.logger.info("✅ Enhanced app stopped cleanly")
 
+        # Flush queued log records
+        if self._log_listener:
+            self._log_listener.stop()
+
+            # Write out whatever the buffering file handlers still hold
+            for handler in self._log_listener.handlers:
+                handler.flush()
+
 
 class SettingsScreen(MDScreen):
     """Enhanced settings screen with sync statistics and controls"""
@@ -2081,6 +3084,7 @@ class SettingsScreen(MDScreen):
         super().__init__(**kwargs)
         self.app = app_instance
         self.name = 'settings'
+        self._clear_dialog = None  # Built once, reused on every open
         self.setup_ui()
 
     def setup_ui(self):
@@ -2157,6 +3161,17 @@ class SettingsScreen(MDScreen):
 
         self.stats_layout = MDBoxLayout(orientation='vertical', spacing=dp(4))
 
+        # One label per statistic, built once; update_stats_display only changes their text
+        self._stat_labels = []
+        for _ in range(5):
+            label = MDLabel(
+                font_style='Body2',
+                size_hint_y=None,
+                height=dp(20)
+            )
+            self._stat_labels.append(label)
+            self.stats_layout.add_widget(label)
+
         layout.add_widget(title)
         layout.add_widget(self.stats_layout)
         card.add_widget(layout)
@@ -2185,6 +3200,17 @@ class SettingsScreen(MDScreen):
 
         self.device_info_layout = MDBoxLayout(orientation='vertical', spacing=dp(4))
 
+        # Enough labels for the longest listing, built once; unused ones are left blank
+        self._info_labels = []
+        for _ in range(7):
+            label = MDLabel(
+                font_style='Body2',
+                size_hint_y=None,
+                height=dp(18)
+            )
+            self._info_labels.append(label)
+            self.device_info_layout.add_widget(label)
+
         layout.add_widget(title)
         layout.add_widget(self.device_info_layout)
         card.add_widget(layout)
@@ -2314,16 +3340,6 @@ class SettingsScreen(MDScreen):
             ("🗑️ Clear Data", self.clear_data, (0.7, 0.2, 0.2, 1))
         ]
 
-        for text, callback, color in buttons:
-            btn = MDRaisedButton(
-                text=text,
-                size_hint_y=None,
-                height=dp(40),
-                on_release=callback,
-                md_bg_color=color
-            )
-            layout.add_widget(btn)
-
         layout.add_widget(title)
         for text, callback, color in buttons:
             btn = MDRaisedButton(
@@ -2343,10 +3359,8 @@ class SettingsScreen(MDScreen):
         self.update_stats_display()
         self.update_device_info_display()
 
-    def update_stats_display(self):
+    def update_stats_display(self, *args):
         """Update statistics display"""
-        self.stats_layout.clear_widgets()
-
         stats_data = [
             f"Total Synced: {self.app.total_synced_calls}",
             f"Sync Failures: {self.app.sync_failures}",
@@ -2355,30 +3369,21 @@ class SettingsScreen(MDScreen):
             f"Connection: {'✅ Healthy' if self.app.backend_api.connection_healthy else '❌ Poor'}"
         ]
 
-        for stat in stats_data:
-            label = MDLabel(
-                text=stat,
-                font_style='Body2',
-                size_hint_y=None,
-                height=dp(20)
-            )
-            self.stats_layout.add_widget(label)
+        for label, stat in zip(self._stat_labels, stats_data):
+            label.text = stat
 
     def update_device_info_display(self):
         """Update device information display"""
-        self.device_info_layout.clear_widgets()
-
         try:
-            if self.app.storage.exists('device_info'):
-                device_info = self.app.storage.get('device_info')
-                device_id = device_info.get('device_id', 'Not registered')
-                device_name = device_info.get('device_name', 'Unknown')
-                registration_time = device_info.get('registration_time')
+            device_info = self.app.get_device_info()
+            if device_info:
+                device_id = device_info.device_id or 'Not registered'
+                device_name = device_info.device_name or 'Unknown'
 
                 device_data = [
                     f"Device ID: {device_id[:12]}..." if len(device_id) > 12 else f"Device ID: {device_id}",
                     f"Device Name: {device_name}",
-                    f"Registered: {datetime.fromisoformat(registration_time).strftime('%Y-%m-%d %H:%M') if registration_time else 'Never'}",
+                    f"Registered: {format_registration_time(device_info.registration_time)}",
                     f"Permissions: {'✅ Granted' if self.app.call_manager.permissions_granted else '❌ Not Granted'}",
                     f"Platform: {platform} | Android: {'✅' if ANDROID_AVAILABLE else '❌'}",
                     f"QR Scanner: {'✅' if SCANNER_AVAILABLE else '❌'}",
@@ -2394,24 +3399,11 @@ class SettingsScreen(MDScreen):
                     f"App Version: 2.0.0 Enhanced"
                 ]
 
-            for data in device_data:
-                label = MDLabel(
-                    text=data,
-                    font_style='Body2',
-                    size_hint_y=None,
-                    height=dp(18)
-                )
-                self.device_info_layout.add_widget(label)
-
         except Exception as e:
-            error_label = MDLabel(
-                text=f"Error loading device info: {str(e)}",
-                font_style='Body2',
-                theme_text_color='Secondary',
-                size_hint_y=None,
-                height=dp(20)
-            )
-            self.device_info_layout.add_widget(error_label)
+            device_data = [f"Error loading device info: {str(e)}"]
+
+        for label, text in zip_longest(self._info_labels, device_data, fillvalue=''):
+            label.text = text
 
     def toggle_auto_sync(self, *args):
         """Toggle auto sync setting"""
@@ -2435,59 +3427,76 @@ class SettingsScreen(MDScreen):
     def manual_sync(self, *args):
         """Trigger manual sync"""
         SimpleNotification.show_info("🔄 Starting manual sync...")
-        threading.Thread(target=self._manual_sync_thread, daemon=True).start()
+        self.app.run_in_background(self._manual_sync_thread)
 
     def _manual_sync_thread(self):
         """Manual sync in background"""
         try:
             if not self.app.backend_api.device_id:
-                Clock.schedule_once(
-                    lambda dt: SimpleNotification.show_error("❌ Device not registered. Scan QR code first."), 0)
+                SimpleNotification.show_error("❌ Device not registered. Scan QR code first.")
                 return
 
-            calls = self.app.call_manager.get_call_logs(limit=1000, force_refresh=True)
+            # Stream calls in batches so only one batch is held and uploaded at a time
+            synced_count = 0
+            duplicate_count = 0
+            batch_count = 0
 
-            if not calls:
-                Clock.schedule_once(lambda dt: SimpleNotification.show_info("ℹ️ No calls to sync"), 0)
-                return
+            for batch in self.app.call_manager.get_call_logs_iter(batch=100, limit=1000):
+                result = self.app.backend_api.sync_calls_batch(batch, batch_count)
 
-            result = self.app.backend_api.sync_calls(calls, force=True)
+                if not result['success']:
+                    self.app.sync_failures += 1
+                    self._finish_manual_sync(f"❌ Manual sync failed: {result.get('message', 'Unknown error')}",
+                                             failed=True)
+                    return
 
-            if result['success']:
-                synced_count = result.get('synced_count', 0)
-                self.app.total_synced_calls += synced_count
-                self.app.last_sync_time = datetime.now()
-                self.app.update_app_setting('last_sync_time', self.app.last_sync_time.isoformat())
+                batch_count += 1
+                synced_count += result.get('synced_count', 0)
+                duplicate_count += result.get('duplicate_count', 0)
+                self.app.total_synced_calls += result.get('synced_count', 0)
 
-                sync_msg = f"✅ Manual sync: {synced_count} calls"
-                if result.get('duplicate_count', 0) > 0:
-                    sync_msg += f" ({result['duplicate_count']} duplicates)"
+                progress_msg = f"⏳ Synced {synced_count} calls ({batch_count} batches)..."
+                SimpleNotification.show_info(progress_msg)
 
-                Clock.schedule_once(lambda dt: SimpleNotification.show_message(sync_msg), 0)
-                Clock.schedule_once(self.update_stats_display, 0.5)
-            else:
-                self.app.sync_failures += 1
-                error_msg = f"❌ Manual sync failed: {result.get('message', 'Unknown error')}"
-                Clock.schedule_once(lambda dt: SimpleNotification.show_error(error_msg), 0)
+            if not batch_count:
+                SimpleNotification.show_info("ℹ️ No calls to sync")
+                return
+
+            self.app.record_sync_time()
+
+            sync_msg = f"✅ Manual sync: {synced_count} calls"
+            if duplicate_count > 0:
+                sync_msg += f" ({duplicate_count} duplicates)"
+
+            self._finish_manual_sync(sync_msg)
 
         except Exception as e:
             error_message = f"❌ Manual sync error: {str(e)}"
-            Clock.schedule_once(lambda dt: SimpleNotification.show_error(error_message), 0)
+            SimpleNotification.show_error(error_message)
+
+    @mainthread
+    def _finish_manual_sync(self, message: str, failed: bool = False):
+        """Show the sync result and refresh the statistics in one main-thread pass"""
+        if failed:
+            SimpleNotification.show_error(message)
+        else:
+            SimpleNotification.show_message(message)
+        self.update_stats_display()
 
     def test_connection(self, *args):
         """Test server connection"""
         SimpleNotification.show_info("🔍 Testing connection...")
-        threading.Thread(target=self._test_connection_thread, daemon=True).start()
+        self.app.run_in_background(self._test_connection_thread)
 
     def _test_connection_thread(self):
         """Test connection in background"""
         result = self.app.backend_api.test_connection()
 
         if result['success']:
-            Clock.schedule_once(lambda dt: SimpleNotification.show_message("✅ Connection successful!"), 0)
+            SimpleNotification.show_message("✅ Connection successful!")
         else:
             error_msg = result.get('message', 'Unknown error')
-            Clock.schedule_once(lambda dt: SimpleNotification.show_error(f"❌ Connection failed: {error_msg}"), 0)
+            SimpleNotification.show_error(f"❌ Connection failed: {error_msg}")
 
     def show_qr_scanner(self, *args):
         """Show QR scanner"""
@@ -2509,12 +3518,12 @@ class SettingsScreen(MDScreen):
 
     def send_heartbeat(self, *args):
         """Send manual heartbeat"""
-        threading.Thread(target=self._send_heartbeat_thread, daemon=True).start()
+        self.app.run_in_background(self._send_heartbeat_thread)
 
     def _send_heartbeat_thread(self):
         """Send heartbeat in background"""
         if not self.app.backend_api.device_id:
-            Clock.schedule_once(lambda dt: SimpleNotification.show_error("❌ Device not registered"), 0)
+            SimpleNotification.show_error("❌ Device not registered")
             return
 
         result = self.app.backend_api.send_heartbeat({
@@ -2523,29 +3532,30 @@ class SettingsScreen(MDScreen):
         })
 
         if result['success']:
-            Clock.schedule_once(lambda dt: SimpleNotification.show_message("💓 Heartbeat sent successfully"), 0)
+            SimpleNotification.show_message("💓 Heartbeat sent successfully")
         else:
             error_message = f"💔 Heartbeat failed: {result.get('message')}"
-            Clock.schedule_once(lambda dt: SimpleNotification.show_error(error_message), 0)
+            SimpleNotification.show_error(error_message)
 
     def clear_data(self, *args):
         """Clear all app data with confirmation"""
-        confirm_dialog = MDDialog(
-            title="⚠️ Clear All Data",
-            text="This will remove:\n• Device registration\n• Sync settings\n• All cached data\n\nAre you sure?",
-            buttons=[
-                MDFlatButton(
-                    text="CANCEL",
-                    on_release=lambda x: confirm_dialog.dismiss()
-                ),
-                MDRaisedButton(
-                    text="CLEAR ALL DATA",
-                    on_release=lambda x: self.perform_clear_data(confirm_dialog),
-                    md_bg_color=(0.8, 0.2, 0.2, 1)
-                ),
-            ],
-        )
-        confirm_dialog.open()
+        if not self._clear_dialog:
+            self._clear_dialog = MDDialog(
+                title="⚠️ Clear All Data",
+                text="This will remove:\n• Device registration\n• Sync settings\n• All cached data\n\nAre you sure?",
+                buttons=[
+                    MDFlatButton(
+                        text="CANCEL",
+                        on_release=lambda x: self._clear_dialog.dismiss()
+                    ),
+                    MDRaisedButton(
+                        text="CLEAR ALL DATA",
+                        on_release=lambda x: self.perform_clear_data(self._clear_dialog),
+                        md_bg_color=(0.8, 0.2, 0.2, 1)
+                    ),
+                ],
+            )
+        self._clear_dialog.open()
 
     def perform_clear_data(self, dialog):
         """Actually clear the data"""
@@ -2553,19 +3563,16 @@ class SettingsScreen(MDScreen):
 
         try:
             # Clear all storage
-            keys_to_delete = []
-            for key in self.app.storage.keys():
-                keys_to_delete.append(key)
-
-            for key in keys_to_delete:
-                if self.app.storage.exists(key):
-                    self.app.storage.delete(key)
+            self.app.reset_app_settings()
+            self.app.storage.clear()  # One rewrite of the store, not one per key
+            self.app.clear_device_info()  # Entry is already gone; this drops the in-memory copy
 
             # Reset app state
-            self.app.backend_api.device_id = None
+            self.app.backend_api.set_device_id(None)
             self.app.backend_api.device_name = None
             self.app.total_synced_calls = 0
             self.app.last_sync_time = None
+            self.app.last_sync_time_iso = None
             self.app.sync_failures = 0
             self.app.auto_sync_enabled = True
 
@@ -2607,8 +3614,7 @@ if __name__ == '__main__':
     print("   ✅ BRUTE FORCE SYNC - Ensures data reaches server")
     print()
     print("🛡️  RELIABILITY FEATURES:")
-    print("   • 5 retry attempts for sync operations")
-    print("   • 3 retry attempts for registration")
+    print("   • 5 transport-level retries for every request (errors and 5xx)")
     print("   • Exponential backoff on failures")
     print("   • Automatic service restart on errors")
     print("   • Real-time call monitoring every 10 seconds")